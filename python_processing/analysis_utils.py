@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the Rwanda trade analysis scripts
+JSON encoding options for orjson output and top-k selection over NumPy arrays.
+"""
+
+from typing import Any
+
+import numpy as np
+import orjson
+
+# orjson options shared by every encode; callers add OPT_INDENT_2 for pretty output
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def orjson_default(obj: Any) -> Any:
+    """Convert the leaves orjson cannot encode on its own (e.g. non-contiguous arrays, numpy scalars of odd dtypes)."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest values, largest first; equal values keep their input order."""
+    # A full stable sort (rather than argpartition, which breaks ties at the cutoff
+    # arbitrarily) is cheap at the few hundred rows these tables hold
+    return np.argsort(-values, kind='stable')[:k]
@@ -6,10 +6,45 @@ for API consumption and frontend visualization.
 """
 
 import pandas as pd
-import json
+import orjson
 import numpy as np
 from datetime import datetime
 import os
+import re
+
+
+def _compile_keyword_classifier(mapping):
+    """Compile each group's keywords into one case-insensitive pattern, preserving group order"""
+    return [
+        (group, re.compile('|'.join(re.escape(keyword) for keyword in keywords), re.IGNORECASE))
+        for group, keywords in mapping.items()
+    ]
+
+
+def _classify(name, classifier, default='Other'):
+    """Return the first group whose pattern occurs in name"""
+    for group, pattern in classifier:
+        if pattern.search(name):
+            return group
+    return default
+
+
+# Map regional blocks to continents
+CONTINENT_CLASSIFIER = _compile_keyword_classifier({
+    'Asia': ['ASEAN', 'SAARC', 'Shanghai Cooperation', 'Asia'],
+    'Africa': ['EAC', 'SADC', 'COMESA', 'CEPGL', 'ECOWAS', 'African Union', 'Africa'],
+    'Europe': ['EU', 'European Union', 'EEA', 'Europe'],
+    'Americas': ['NAFTA', 'USMCA', 'MERCOSUR', 'CARICOM', 'Americas', 'North America', 'South America'],
+    'Oceania': ['Pacific Islands', 'Oceania']
+})
+
+# Map to the regions expected by frontend
+REGION_CLASSIFIER = _compile_keyword_classifier({
+    'Asia': ['ASEAN', 'SAARC', 'Shanghai', 'Asia'],
+    'Africa': ['EAC', 'SADC', 'COMESA', 'CEPGL', 'ECOWAS', 'Africa'],
+    'Europe': ['EU', 'European Union', 'EEA', 'Europe'],
+    'Americas': ['NAFTA', 'USMCA', 'MERCOSUR', 'CARICOM', 'Americas']
+})
 
 class RegionalBlocksAnalyzer:
     def __init__(self, excel_file_path):
@@ -19,10 +54,16 @@ class RegionalBlocksAnalyzer:
 
     def load_regional_blocks_data(self):
         """Load and clean the regional blocks data from Excel"""
+        # Read the Regional blocks sheet without headers first
         try:
-            # Read the Regional blocks sheet without headers first
             df = pd.read_excel(self.excel_file_path, sheet_name='Regional blocks', header=None)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Error loading regional blocks data: {e}")
+            return None
 
+        # Copy-on-write (scoped to this cleanup) lets the slices below share memory
+        # with the raw sheet until they are written to
+        with pd.option_context('mode.copy_on_write', True):
             print(f"Raw data shape: {df.shape}")
 
             # Find the header row and data start
@@ -61,7 +102,7 @@ class RegionalBlocksAnalyzer:
                     headers.append(str(val).strip())
 
             # Extract data rows
-            data_df = df.iloc[data_start_idx:].copy()
+            data_df = df.iloc[data_start_idx:]
             data_df.columns = headers[:len(data_df.columns)]
 
             # Rename 'Partner' column to 'regional_block' if it exists
@@ -98,12 +139,6 @@ class RegionalBlocksAnalyzer:
 
             return data_df
 
-        except Exception as e:
-            print(f"Error loading regional blocks data: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
-
     def analyze_regional_blocks(self, df):
         """Analyze the regional blocks data and create various output formats"""
 
@@ -202,15 +237,6 @@ class RegionalBlocksAnalyzer:
 
     def _create_continental_distribution(self, df):
         """Create continental distribution analysis"""
-        # Map regional blocks to continents
-        continent_mapping = {
-            'Asia': ['ASEAN', 'SAARC', 'Shanghai Cooperation', 'Asia'],
-            'Africa': ['EAC', 'SADC', 'COMESA', 'CEPGL', 'ECOWAS', 'African Union', 'Africa'],
-            'Europe': ['EU', 'European Union', 'EEA', 'Europe'],
-            'Americas': ['NAFTA', 'USMCA', 'MERCOSUR', 'CARICOM', 'Americas', 'North America', 'South America'],
-            'Oceania': ['Pacific Islands', 'Oceania']
-        }
-
         distribution = {
             'generated_at': datetime.now().isoformat(),
             'continental_distribution': [],
@@ -230,11 +256,7 @@ class RegionalBlocksAnalyzer:
                 value = float(row[latest_period]) if pd.notna(row[latest_period]) else 0
 
                 # Determine continent
-                continent = 'Other'
-                for cont, keywords in continent_mapping.items():
-                    if any(keyword.lower() in block_name.lower() for keyword in keywords):
-                        continent = cont
-                        break
+                continent = _classify(block_name, CONTINENT_CLASSIFIER)
 
                 if continent not in continent_totals:
                     continent_totals[continent] = 0
@@ -293,14 +315,6 @@ class RegionalBlocksAnalyzer:
             'regional_exports': []
         }
 
-        # Map to the regions expected by frontend
-        region_mapping = {
-            'Asia': ['ASEAN', 'SAARC', 'Shanghai', 'Asia'],
-            'Africa': ['EAC', 'SADC', 'COMESA', 'CEPGL', 'ECOWAS', 'Africa'],
-            'Europe': ['EU', 'European Union', 'EEA', 'Europe'],
-            'Americas': ['NAFTA', 'USMCA', 'MERCOSUR', 'CARICOM', 'Americas']
-        }
-
         # Get latest period data
         numeric_cols = [col for col in df.columns if col != 'regional_block' and
                        df[col].dtype in ['float64', 'int64']]
@@ -314,11 +328,7 @@ class RegionalBlocksAnalyzer:
                 value = float(row[latest_period]) if pd.notna(row[latest_period]) else 0
 
                 # Determine region
-                region = 'Other'
-                for reg, keywords in region_mapping.items():
-                    if any(keyword.lower() in block_name.lower() for keyword in keywords):
-                        region = reg
-                        break
+                region = _classify(block_name, REGION_CLASSIFIER)
 
                 if region not in region_totals:
                     region_totals[region] = 0
@@ -432,12 +442,15 @@ class RegionalBlocksAnalyzer:
         }
 
         exported_files = []
+        json_options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
 
         for filename, data in json_files.items():
             filepath = os.path.join(self.output_dir, filename)
             try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                # Encode to UTF-8 bytes in one pass, then issue a single write
+                payload = orjson.dumps(data, option=json_options)
+                with open(filepath, 'wb') as f:
+                    f.write(payload)
                 exported_files.append(filename)
                 print(f"Exported {filename}")
             except Exception as e:
@@ -5,34 +5,103 @@ Advanced prediction system covering all aspects of Rwanda's trade data
 """
 import pandas as pd
 import numpy as np
-import json
+import orjson
 import os
+import io
+import sys
+import gzip
+import hashlib
+import functools
+import logging
+import statistics
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
 from statsmodels.tsa.arima.model import ARIMA
 from statsmodels.tsa.statespace.sarimax import SARIMAX
-from sklearn.linear_model import LinearRegression
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from sklearn.model_selection import train_test_split
+from joblib import Memory, Parallel, delayed
 import warnings
 warnings.filterwarnings('ignore')
 
+from analysis_utils import ORJSON_OPTIONS, orjson_default, top_k_indices
+
+logger = logging.getLogger(__name__)
+
+# Country prediction flows and the data keys they are loaded under
+COUNTRY_FLOWS = (('exports', 'export_countries'), ('imports', 'import_countries'), ('reexports', 'reexport_countries'))
+
+# Top-level prediction keys that are not prediction categories
+_NON_CATEGORY_KEYS = frozenset({'metadata', 'insights', 'recommendations'})
+
+
+def _linear_trend_forecast(values: np.ndarray, periods: int) -> np.ndarray:
+    """Extend a closed-form least-squares line `periods` steps past the end of `values`.
+
+    Works along the last axis, so a (n_series, n) matrix is fitted in one pass.
+    """
+    n = values.shape[-1]
+    x_centered = np.arange(n) - (n - 1) / 2
+    y_mean = values.mean(axis=-1, keepdims=True)
+    slope = ((values - y_mean) @ x_centered)[..., None] / (x_centered @ x_centered)
+    intercept = y_mean - slope * (n - 1) / 2
+    return intercept + slope * np.arange(n, n + periods)
+
+
+def _fit_exponential_smoothing(values: Tuple[float, ...], periods: int) -> List[float]:
+    """Fit additive Holt-Winters and return the point forecast."""
+    # A seasonal component needs two full years of quarters; shorter series use plain smoothing
+    seasonal = {'seasonal': 'add', 'seasonal_periods': 4} if len(values) >= 8 else {}
+    model = ExponentialSmoothing(np.asarray(values, dtype=float), **seasonal)
+    return model.fit().forecast(periods).tolist()
+
+
+def _fit_arima(values: Tuple[float, ...], periods: int) -> List[float]:
+    """Fit ARIMA(1,1,1) and return the point forecast."""
+    model = ARIMA(np.asarray(values, dtype=float), order=(1, 1, 1))
+    # Only point forecasts are used, so skip parameter covariance and smoother output
+    return model.fit(cov_type='none', low_memory=True).forecast(periods).tolist()
+
+
+def _fit_sarimax(values: Tuple[float, ...], periods: int) -> List[float]:
+    """Fit SARIMA(1,1,1)(1,1,1,4) and return the point forecast."""
+    model = SARIMAX(np.asarray(values, dtype=float), order=(1, 1, 1), seasonal_order=(1, 1, 1, 4))
+    return model.fit(disp=False, cov_type='none', low_memory=True).forecast(periods).tolist()
+
+
+def _memoize_forecast(method):
+    """Cache a forecaster's result per (values, periods) on the predictor instance."""
+    @functools.wraps(method)
+    def wrapper(self, values, periods):
+        key = (method.__name__, tuple(values), periods)
+        if key not in self._forecast_cache:
+            self._forecast_cache[key] = method(self, values, periods)
+        return self._forecast_cache[key]
+    return wrapper
+
+
 class ComprehensiveRwandaTradePredictor:
     """Comprehensive predictor for all aspects of Rwanda's trade data."""
 
-    def __init__(self, excel_file: str):
+    def __init__(self, excel_file: str, n_jobs: int = -1):
         self.excel_file = excel_file
+        self.n_jobs = n_jobs
         self.output_dir = Path("data/processed")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Local caches live outside the published outputs (and are git-ignored)
+        self.cache_dir = Path("data/cache")
 
         # Load all data from Excel
         self.data = self.load_all_excel_data()
-
-        # Initialize forecasting models
+        self._build_country_block()
+
+        # Initialize forecasting models; statsmodels fits are also cached on disk across runs
+        self._forecast_cache = {}
+        self._memory = Memory(self.cache_dir / 'forecasts', verbose=0)
+        self._fit_exponential_smoothing = self._memory.cache(_fit_exponential_smoothing)
+        self._fit_arima = self._memory.cache(_fit_arima)
+        self._fit_sarimax = self._memory.cache(_fit_sarimax)
         self.models = {
             'exp_smooth': self._forecast_exponential_smoothing,
             'arima': self._forecast_arima,
@@ -43,9 +112,9 @@ class ComprehensiveRwandaTradePredictor:
 
     def load_all_excel_data(self) -> Dict[str, Any]:
         """Load and process all data from Excel file."""
-        print("Loading comprehensive trade data from Excel file...")
+        logger.info("Loading comprehensive trade data from Excel file...")
 
-        excel_data = pd.read_excel(self.excel_file, sheet_name=None)
+        excel_data = self._read_excel_sheets()
         data = {}
 
         # 1. Overall trade data (Graph Overall)
@@ -73,9 +142,49 @@ class ComprehensiveRwandaTradePredictor:
         # 7. Continental data
         data['continents'] = self._process_continental_data(excel_data.get('Trade by continents', pd.DataFrame()))
 
-        print(f"Loaded data from {len(data)} categories")
+        logger.debug(f"Loaded data from {len(data)} categories")
         return data
 
+    def _build_country_block(self):
+        """Pack the country flows into one zero-padded (flows, N_max, 9) float64 block with per-flow names."""
+        flows = [self.data.get(key) or {'names': [], 'values': np.empty((0, 9), dtype=np.float64)}
+                 for _, key in COUNTRY_FLOWS]
+
+        self._country_names = [flow['names'] for flow in flows]
+        self._country_counts = np.array([len(names) for names in self._country_names])
+        self._country_block = np.zeros((len(flows), self._country_counts.max(), 9), dtype=np.float64)
+        for i, flow in enumerate(flows):
+            self._country_block[i, :self._country_counts[i]] = flow['values']
+
+    def _read_excel_sheets(self) -> Dict[str, pd.DataFrame]:
+        """Read all sheets, reusing a pickled copy keyed by the workbook's content hash."""
+        digest = hashlib.md5(Path(self.excel_file).read_bytes()).hexdigest()
+        cache_file = self.cache_dir / 'excel' / f"{digest}.pkl"
+
+        if cache_file.exists():
+            return pd.read_pickle(cache_file)
+
+        # pandas opens the workbook with openpyxl in read-only, values-only mode
+        excel_data = pd.read_excel(self.excel_file, sheet_name=None, engine='openpyxl')
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        pd.to_pickle(excel_data, cache_file)
+        return excel_data
+
+    def _extract_block(self, df: pd.DataFrame, rows: range, cols: range) -> np.ndarray:
+        """Extract a numeric block from a sheet, treating missing or non-numeric cells as 0."""
+        block = np.zeros((len(rows), len(cols)))
+        sub = df.iloc[rows.start:rows.stop, cols.start:cols.stop]
+        if sub.size:
+            numeric = sub.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float, na_value=0.0)
+            block[:numeric.shape[0], :numeric.shape[1]] = numeric
+        return block
+
+    def _extract_labels(self, df: pd.DataFrame, rows: range, col: int) -> List[str]:
+        """Extract stripped string labels from a sheet column, with '' for missing cells."""
+        labels = df.iloc[rows.start:rows.stop, col]
+        return [str(label).strip() if pd.notna(label) else '' for label in labels]
+
     def _process_overall_trade(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Process overall trade data from Graph Overall sheet."""
         if df.empty:
@@ -87,17 +196,10 @@ class ComprehensiveRwandaTradePredictor:
 
         # Extract values for each metric
         metrics = ['exports', 'imports', 're_exports', 'total_trade', 'trade_balance']
-        row_indices = [3, 4, 5, 6, 7]  # Corresponding row indices
-
-        for metric, row_idx in zip(metrics, row_indices):
-            values = []
-            for col_idx in range(3, 12):  # Columns 3-11
-                try:
-                    val = float(df.iloc[row_idx, col_idx]) if pd.notna(df.iloc[row_idx, col_idx]) else 0
-                    values.append(val)
-                except:
-                    values.append(0)
-            data[metric] = values
+        block = self._extract_block(df, range(3, 8), range(3, 12))  # Rows 3-7, columns 3-11
+
+        for metric, values in zip(metrics, block):
+            data[metric] = values.tolist()
 
         return data
 
@@ -112,17 +214,10 @@ class ComprehensiveRwandaTradePredictor:
 
         # Extract EAC exports, imports, re-exports, total trade, balance
         metrics = ['exports', 'imports', 're_exports', 'total_trade', 'trade_balance']
-        row_indices = [2, 3, 4, 5, 6]  # Adjust based on actual structure
-
-        for metric, row_idx in zip(metrics, row_indices):
-            values = []
-            for col_idx in range(1, 10):  # Columns 1-9
-                try:
-                    val = float(df.iloc[row_idx, col_idx]) if pd.notna(df.iloc[row_idx, col_idx]) else 0
-                    values.append(val)
-                except:
-                    values.append(0)
-            data[metric] = values
+        block = self._extract_block(df, range(2, 7), range(1, 10))  # Adjust based on actual structure
+
+        for metric, values in zip(metrics, block):
+            data[metric] = values.tolist()
 
         return data
 
@@ -137,67 +232,58 @@ class ComprehensiveRwandaTradePredictor:
         flows = ['Exports', 'Imports', 'Re-Exports']
         flow_keys = ['exports', 'imports', 're_exports']
 
+        # Scan the sheet once: flow headers, country names and quarterly values
+        rows = range(len(df))
+        flow_labels = df.iloc[:, 0].to_numpy()
+        names = np.array(self._extract_labels(df, rows, 1), dtype=object)
+        block = self._extract_block(df, rows, range(2, 11))  # Quarterly values
+        totals = block.sum(axis=1)
+        section_end = np.array([not name or name == 'nan' or 'Source:' in name for name in names], dtype=bool)
+
         for flow, key in zip(flows, flow_keys):
             # Find rows for this flow
-            flow_rows = df[df.iloc[:, 0] == flow]
-            if not flow_rows.empty:
-                start_idx = flow_rows.index[0] + 1
-
-                # Process each country
-                for idx in range(start_idx, len(df)):
-                    row = df.iloc[idx]
-                    country = str(row.iloc[1]).strip() if pd.notna(row.iloc[1]) else ''
-
-                    if not country or country == 'nan' or 'Source:' in country:
-                        break
+            header_rows = np.flatnonzero(flow_labels == flow)
+            if header_rows.size:
+                start = header_rows[0] + 1
+                # Each section runs until the first blank or 'Source:' row
+                end_rows = np.flatnonzero(section_end[start:])
+                end = start + end_rows[0] if end_rows.size else len(df)
+                keep = start + np.flatnonzero(totals[start:end] > 0)
 
-                    values = []
-                    for col_idx in range(2, 11):  # Quarterly values
-                        try:
-                            val = float(row.iloc[col_idx]) if pd.notna(row.iloc[col_idx]) else 0
-                            values.append(val)
-                        except:
-                            values.append(0)
-
-                    if values and sum(values) > 0:
-                        countries_data[key][country] = values
+                for country, values in zip(names[keep], block[keep]):
+                    countries_data[key][country] = values.tolist()
 
         return countries_data
 
     def _process_country_data(self, df: pd.DataFrame, flow_type: str) -> Dict[str, Any]:
-        """Process country-level trade data."""
+        """Process country-level trade data into parallel `names` and float64 `values` (N x 9) arrays."""
         if df.empty:
-            return {}
-
-        countries = {}
+            return {'names': [], 'values': np.empty((0, 9), dtype=np.float64)}
 
         # Skip header rows and process data rows
-        for idx in range(4, len(df)):
-            row = df.iloc[idx]
-            country = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ''
-
+        rows = range(4, len(df))
+        names = self._extract_labels(df, rows, 0)
+        block = self._extract_block(df, rows, range(1, 10))  # Quarterly values
+        totals = block.sum(axis=1)
+
+        # Map each country to its row; a repeated name keeps its first position and last values
+        country_rows = {}
+        for idx, country in enumerate(names):
             if not country or country == 'nan' or 'Source:' in country:
                 continue
 
-            values = []
-            for col_idx in range(1, 10):  # Quarterly values
-                try:
-                    val = float(row.iloc[col_idx]) if pd.notna(row.iloc[col_idx]) else 0
-                    values.append(val)
-                except:
-                    values.append(0)
-
-            if values and sum(values) > 0:
-                countries[country] = values
+            if totals[idx] > 0:
+                country_rows[country] = idx
 
-        return countries
+        return {
+            'names': list(country_rows),
+            'values': block[list(country_rows.values())]
+        }
 
     def _process_commodity_data(self, df: pd.DataFrame, flow_type: str) -> Dict[str, Any]:
-        """Process commodity-level trade data."""
+        """Process commodity-level trade data into parallel `names`, `sections` and float64 `values` (N x 9) arrays."""
         if df.empty:
-            return {}
-
-        commodities = {}
+            return {'names': [], 'sections': [], 'values': np.empty((0, 9), dtype=np.float64)}
 
         # Find data start
         data_start = 0
@@ -207,30 +293,26 @@ class ComprehensiveRwandaTradePredictor:
                 break
 
         # Process commodities
-        for idx in range(data_start, len(df)):
-            row = df.iloc[idx]
-            section = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ''
-
+        rows = range(data_start, len(df))
+        sections = self._extract_labels(df, rows, 0)
+        descriptions = self._extract_labels(df, rows, 1)
+        block = self._extract_block(df, rows, range(2, 11))  # Quarterly values
+        totals = block.sum(axis=1)
+
+        # Map each description to its row; a repeated name keeps its first position and last values
+        commodity_rows = {}
+        for idx, (section, description) in enumerate(zip(sections, descriptions)):
             if not section or section == 'nan' or section == 'Total Estimates':
                 continue
 
-            description = str(row.iloc[1]).strip() if pd.notna(row.iloc[1]) else f'SITC {section}'
-
-            values = []
-            for col_idx in range(2, 11):  # Quarterly values
-                try:
-                    val = float(row.iloc[col_idx]) if pd.notna(row.iloc[col_idx]) else 0
-                    values.append(val)
-                except:
-                    values.append(0)
+            if totals[idx] > 0:
+                commodity_rows[description or f'SITC {section}'] = idx
 
-            if values and sum(values) > 0:
-                commodities[description] = {
-                    'section': section,
-                    'values': values
-                }
-
-        return commodities
+        return {
+            'names': list(commodity_rows),
+            'sections': [sections[idx] for idx in commodity_rows.values()],
+            'values': block[list(commodity_rows.values())]
+        }
 
     def _process_regional_blocks(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Process regional blocks data."""
@@ -240,10 +322,11 @@ class ComprehensiveRwandaTradePredictor:
         regions = {}
 
         # Process each region
-        for idx in range(1, len(df)):
-            row = df.iloc[idx]
-            region = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ''
+        rows = range(1, len(df))
+        names = self._extract_labels(df, rows, 0)
+        block = self._extract_block(df, rows, range(1, 10))  # Quarterly values
 
+        for region, values in zip(names, block):
             if not region or region == 'nan' or 'Source:' in region:
                 continue
 
@@ -254,14 +337,7 @@ class ComprehensiveRwandaTradePredictor:
             flow_keys = ['exports', 'imports', 're_exports', 'total_trade']
 
             for flow, key in zip(flows, flow_keys):
-                values = []
-                for col_idx in range(1, 10):  # Quarterly values
-                    try:
-                        val = float(row.iloc[col_idx]) if pd.notna(row.iloc[col_idx]) else 0
-                        values.append(val)
-                    except:
-                        values.append(0)
-                region_data[key] = values
+                region_data[key] = values.tolist()
 
             regions[region] = region_data
 
@@ -275,10 +351,11 @@ class ComprehensiveRwandaTradePredictor:
         continents = {}
 
         # Process each continent
-        for idx in range(1, len(df)):
-            row = df.iloc[idx]
-            continent = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ''
+        rows = range(1, len(df))
+        names = self._extract_labels(df, rows, 0)
+        block = self._extract_block(df, rows, range(1, 10))  # Quarterly values
 
+        for continent, values in zip(names, block):
             if not continent or continent == 'nan' or continent == 'WORLD':
                 continue
 
@@ -289,14 +366,7 @@ class ComprehensiveRwandaTradePredictor:
             flow_keys = ['exports', 'imports', 're_exports']
 
             for flow, key in zip(flows, flow_keys):
-                values = []
-                for col_idx in range(1, 10):  # Quarterly values
-                    try:
-                        val = float(row.iloc[col_idx]) if pd.notna(row.iloc[col_idx]) else 0
-                        values.append(val)
-                    except:
-                        values.append(0)
-                continent_data[key] = values
+                continent_data[key] = values.tolist()
 
             continents[continent] = continent_data
 
@@ -307,7 +377,7 @@ class ComprehensiveRwandaTradePredictor:
         """Forecast time series using specified method."""
         if not values or len(values) < 2:
             return {
-                'forecast': [np.mean(values) if values else 0] * periods,
+                'forecast': [statistics.fmean(values) if values else 0.0] * periods,
                 'method': 'average',
                 'confidence': 50
             }
@@ -318,74 +388,87 @@ class ComprehensiveRwandaTradePredictor:
         try:
             return self.models[method](values, periods)
         except Exception as e:
-            print(f"Forecasting failed with {method}: {e}")
+            logger.debug(f"Forecasting failed with {method}: {e}")
             # Fallback to simple average
             return {
-                'forecast': [np.mean(values)] * periods,
+                'forecast': [statistics.fmean(values)] * periods,
                 'method': 'average_fallback',
                 'confidence': 40
             }
 
+    def _forecast_many(self, series: List[List[float]], periods: int, method: str) -> List[Dict[str, Any]]:
+        """Forecast independent series concurrently, returning results in input order."""
+        if method == 'linear_trend' and series and len(series[0]) >= 2 and \
+                all(len(values) == len(series[0]) for values in series):
+            # Equal-length series share one design matrix, so fit them all at once
+            forecasts = _linear_trend_forecast(np.asarray(series, dtype=float), periods)
+            return [
+                {'forecast': forecast.tolist(), 'method': 'linear_trend', 'confidence': 65}
+                for forecast in np.maximum(forecasts, 0)
+            ]
+
+        return Parallel(n_jobs=self.n_jobs, prefer='threads')(
+            delayed(self.forecast_time_series)(values, periods, method) for values in series
+        )
+
+    @_memoize_forecast
     def _forecast_exponential_smoothing(self, values: List[float], periods: int) -> Dict[str, Any]:
         """Exponential smoothing forecast."""
         try:
-            model = ExponentialSmoothing(values, seasonal='add', seasonal_periods=4)
-            fitted_model = model.fit()
-            forecast = fitted_model.forecast(periods)
             return {
-                'forecast': forecast.tolist(),
+                'forecast': self._fit_exponential_smoothing(tuple(values), periods),
                 'method': 'exponential_smoothing',
                 'confidence': 75
             }
         except:
             return self._forecast_linear_trend(values, periods)
 
+    @_memoize_forecast
     def _forecast_arima(self, values: List[float], periods: int) -> Dict[str, Any]:
         """ARIMA forecast."""
+        if len(values) < 4:
+            # Too short to estimate ARMA terms after differencing
+            return self._forecast_linear_trend(values, periods)
+
         try:
-            model = ARIMA(values, order=(1, 1, 1))
-            fitted_model = model.fit()
-            forecast = fitted_model.forecast(periods)
             return {
-                'forecast': forecast.tolist(),
+                'forecast': self._fit_arima(tuple(values), periods),
                 'method': 'arima',
                 'confidence': 70
             }
         except:
             return self._forecast_linear_trend(values, periods)
 
+    @_memoize_forecast
     def _forecast_sarimax(self, values: List[float], periods: int) -> Dict[str, Any]:
         """SARIMAX forecast."""
+        if len(values) < 12:
+            # Seasonal differencing at lag 4 leaves too few observations to fit
+            return self._forecast_arima(values, periods)
+
         try:
-            model = SARIMAX(values, order=(1, 1, 1), seasonal_order=(1, 1, 1, 4))
-            fitted_model = model.fit(disp=False)
-            forecast = fitted_model.forecast(periods)
             return {
-                'forecast': forecast.tolist(),
+                'forecast': self._fit_sarimax(tuple(values), periods),
                 'method': 'sarimax',
                 'confidence': 80
             }
         except:
             return self._forecast_arima(values, periods)
 
+    @_memoize_forecast
     def _forecast_linear_trend(self, values: List[float], periods: int) -> Dict[str, Any]:
         """Linear trend forecast."""
         try:
-            x = np.arange(len(values))
-            slope, intercept = np.polyfit(x, values, 1)
-
-            forecast = []
-            for i in range(1, periods + 1):
-                pred = intercept + slope * (len(values) + i - 1)
-                forecast.append(max(0, pred))  # Ensure non-negative
+            forecast = _linear_trend_forecast(np.asarray(values, dtype=float), periods)
+            forecast = np.maximum(forecast, 0)  # Ensure non-negative
 
             return {
-                'forecast': forecast,
+                'forecast': forecast.tolist(),
                 'method': 'linear_trend',
                 'confidence': 65
             }
         except:
-            avg = np.mean(values)
+            avg = statistics.fmean(values)
             return {
                 'forecast': [avg] * periods,
                 'method': 'average',
@@ -397,10 +480,15 @@ class ComprehensiveRwandaTradePredictor:
         forecasts = []
 
         # Try different methods
-        methods = ['exponential_smoothing', 'arima', 'linear_trend']
-        for method in methods:
+        components = {
+            'exponential_smoothing': self._forecast_exponential_smoothing,
+            'arima': self._forecast_arima,
+            'linear_trend': self._forecast_linear_trend
+        }
+        methods = list(components)
+        for forecaster in components.values():
             try:
-                result = self.models[method.replace('_', '')](values, periods)
+                result = forecaster(values, periods)
                 forecasts.append(result['forecast'])
             except:
                 continue
@@ -422,23 +510,16 @@ class ComprehensiveRwandaTradePredictor:
         """Generate next quarter labels."""
         try:
             year, quarter = last_quarter.split('Q')
-            year = int(year)
-            quarter = int(quarter)
-
-            next_quarters = []
-            for i in range(1, periods + 1):
-                quarter += 1
-                if quarter > 4:
-                    quarter = 1
-                    year += 1
-                next_quarters.append(f"{year}Q{quarter}")
-            return next_quarters
+            # Count quarters from year 0 (0-based) so year and quarter fall out of one divmod
+            last_index = int(year) * 4 + int(quarter) - 1
+
+            return [f"{y}Q{q + 1}" for y, q in (divmod(last_index + i, 4) for i in range(1, periods + 1))]
         except:
             return [f"2025Q{i}" for i in range(2, periods + 2)]
 
     def generate_comprehensive_predictions(self, forecast_periods: int = 4) -> Dict[str, Any]:
         """Generate comprehensive predictions for all aspects."""
-        print(f"Generating comprehensive predictions for next {forecast_periods} quarters...")
+        logger.info(f"Generating comprehensive predictions for next {forecast_periods} quarters...")
 
         predictions = {
             'metadata': {
@@ -461,37 +542,44 @@ class ComprehensiveRwandaTradePredictor:
         last_quarter = self.data.get('overall', {}).get('quarters', ['2025Q1'])[-1]
         next_quarters = self.generate_next_quarters(last_quarter, forecast_periods)
 
-        # 1. Overall trade predictions
-        if 'overall' in self.data:
-            predictions['overall_predictions'] = self._predict_overall_trade(
-                self.data['overall'], next_quarters, forecast_periods
+        # The six prediction stages read and write disjoint keys, so run them concurrently
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = {}
+
+            # 1. Overall trade predictions
+            if 'overall' in self.data:
+                futures['overall_predictions'] = executor.submit(
+                    self._predict_overall_trade, self.data['overall'], next_quarters, forecast_periods
+                )
+
+            # 2. EAC predictions
+            if 'eac' in self.data:
+                futures['eac_predictions'] = executor.submit(
+                    self._predict_eac_trade, self.data['eac'], next_quarters, forecast_periods
+                )
+
+            # 3. Country-level predictions
+            futures['country_predictions'] = executor.submit(
+                self._predict_country_trade, next_quarters, forecast_periods
             )
 
-        # 2. EAC predictions
-        if 'eac' in self.data:
-            predictions['eac_predictions'] = self._predict_eac_trade(
-                self.data['eac'], next_quarters, forecast_periods
+            # 4. Commodity predictions
+            futures['commodity_predictions'] = executor.submit(
+                self._predict_commodity_trade, next_quarters, forecast_periods
             )
 
-        # 3. Country-level predictions
-        predictions['country_predictions'] = self._predict_country_trade(
-            next_quarters, forecast_periods
-        )
+            # 5. Regional predictions
+            futures['regional_predictions'] = executor.submit(
+                self._predict_regional_trade, next_quarters, forecast_periods
+            )
 
-        # 4. Commodity predictions
-        predictions['commodity_predictions'] = self._predict_commodity_trade(
-            next_quarters, forecast_periods
-        )
+            # 6. Continental predictions
+            futures['continental_predictions'] = executor.submit(
+                self._predict_continental_trade, next_quarters, forecast_periods
+            )
 
-        # 5. Regional predictions
-        predictions['regional_predictions'] = self._predict_regional_trade(
-            next_quarters, forecast_periods
-        )
-
-        # 6. Continental predictions
-        predictions['continental_predictions'] = self._predict_continental_trade(
-            next_quarters, forecast_periods
-        )
+            for key, future in futures.items():
+                predictions[key] = future.result()
 
         # Generate insights and recommendations
         predictions['insights'] = self._generate_comprehensive_insights(predictions)
@@ -515,15 +603,15 @@ class ComprehensiveRwandaTradePredictor:
                     'values': forecast_result['forecast'],
                     'method': forecast_result['method'],
                     'confidence': forecast_result['confidence'],
-                    'historical_avg': float(np.mean(values)),
-                    'last_value': float(values[-1]) if values else 0
+                    'historical_avg': statistics.fmean(values) if values else 0.0,
+                    'last_value': float(values[-1]) if values else 0.0
                 }
 
         # Calculate derived trade balance
         if 'exports' in predictions and 'imports' in predictions:
             exp_vals = predictions['exports']['values']
             imp_vals = predictions['imports']['values']
-            balance_vals = [e - i for e, i in zip(exp_vals, imp_vals)]
+            balance_vals = np.subtract(exp_vals, imp_vals).tolist()
 
             predictions['trade_balance_calculated'] = {
                 'quarters': next_quarters,
@@ -546,30 +634,33 @@ class ComprehensiveRwandaTradePredictor:
             'reexports': {}
         }
 
-        # Top countries for each flow
-        country_data = {
-            'exports': self.data.get('export_countries', {}),
-            'imports': self.data.get('import_countries', {}),
-            'reexports': self.data.get('reexport_countries', {})
-        }
+        block = self._country_block
+        n_max = block.shape[1]
+        if not n_max:
+            return predictions
+
+        # Rank every flow at once; padding rows get -inf so they never make the top 5
+        totals = block.sum(axis=2)
+        totals[np.arange(n_max) >= self._country_counts[:, None]] = -np.inf
+        k = min(5, n_max)
+        candidates = np.sort(np.argpartition(-totals, k - 1, axis=1)[:, :k], axis=1)
 
-        for flow_type, countries in country_data.items():
+        for i, (flow_type, _) in enumerate(COUNTRY_FLOWS):
             # Get top 5 countries by total value
-            top_countries = sorted(countries.items(),
-                                 key=lambda x: sum(x[1]) if x[1] else 0,
-                                 reverse=True)[:5]
-
-            for country, values in top_countries:
-                if len(values) >= 2:
-                    forecast_result = self.forecast_time_series(values, periods, 'linear_trend')
-                    predictions[flow_type][country] = {
-                        'quarters': next_quarters,
-                        'values': forecast_result['forecast'],
-                        'method': forecast_result['method'],
-                        'confidence': forecast_result['confidence'],
-                        'historical_total': float(sum(values)),
-                        'last_value': float(values[-1])
-                    }
+            top_idx = candidates[i][np.argsort(-totals[i, candidates[i]], kind='stable')]
+            top_idx = top_idx[:self._country_counts[i]]
+
+            forecasts = self._forecast_many(block[i, top_idx].tolist(), periods, 'linear_trend')
+
+            for idx, forecast_result in zip(top_idx, forecasts):
+                predictions[flow_type][self._country_names[i][idx]] = {
+                    'quarters': next_quarters,
+                    'values': forecast_result['forecast'],
+                    'method': forecast_result['method'],
+                    'confidence': forecast_result['confidence'],
+                    'historical_total': float(totals[i, idx]),
+                    'last_value': float(block[i, idx, -1])
+                }
 
         return predictions
 
@@ -582,31 +673,32 @@ class ComprehensiveRwandaTradePredictor:
         }
 
         commodity_data = {
-            'exports': self.data.get('export_commodities', {}),
-            'imports': self.data.get('import_commodities', {}),
-            'reexports': self.data.get('reexport_commodities', {})
+            'exports': self.data.get('export_commodities'),
+            'imports': self.data.get('import_commodities'),
+            'reexports': self.data.get('reexport_commodities')
         }
 
         for flow_type, commodities in commodity_data.items():
+            if not commodities or commodities['values'].shape[1] < 2:
+                continue
+
             # Get top 5 commodities by total value
-            top_commodities = sorted(
-                [(name, data['values']) for name, data in commodities.items()],
-                key=lambda x: sum(x[1]) if x[1] else 0,
-                reverse=True
-            )[:5]
-
-            for commodity, values in top_commodities:
-                if len(values) >= 2:
-                    forecast_result = self.forecast_time_series(values, periods, 'linear_trend')
-                    predictions[flow_type][commodity] = {
-                        'quarters': next_quarters,
-                        'values': forecast_result['forecast'],
-                        'method': forecast_result['method'],
-                        'confidence': forecast_result['confidence'],
-                        'historical_total': float(sum(values)),
-                        'last_value': float(values[-1]),
-                        'section': commodities[commodity]['section']
-                    }
+            values = commodities['values']
+            totals = values.sum(axis=1)
+            top_idx = top_k_indices(totals, 5)
+
+            forecasts = self._forecast_many(values[top_idx].tolist(), periods, 'linear_trend')
+
+            for idx, forecast_result in zip(top_idx, forecasts):
+                predictions[flow_type][commodities['names'][idx]] = {
+                    'quarters': next_quarters,
+                    'values': forecast_result['forecast'],
+                    'method': forecast_result['method'],
+                    'confidence': forecast_result['confidence'],
+                    'historical_total': float(totals[idx]),
+                    'last_value': float(values[idx, -1]),
+                    'section': commodities['sections'][idx]
+                }
 
         return predictions
 
@@ -615,23 +707,26 @@ class ComprehensiveRwandaTradePredictor:
         predictions = {}
 
         regional_data = self.data.get('regional_blocks', {})
+        series = []
 
         for region, region_data in regional_data.items():
             predictions[region] = {}
 
             for flow_type in ['exports', 'imports', 're_exports', 'total_trade']:
-                if flow_type in region_data:
-                    values = region_data[flow_type]
-                    if len(values) >= 2:
-                        forecast_result = self.forecast_time_series(values, periods, 'linear_trend')
-                        predictions[region][flow_type] = {
-                            'quarters': next_quarters,
-                            'values': forecast_result['forecast'],
-                            'method': forecast_result['method'],
-                            'confidence': forecast_result['confidence'],
-                            'historical_total': float(sum(values)),
-                            'last_value': float(values[-1])
-                        }
+                if flow_type in region_data and len(region_data[flow_type]) >= 2:
+                    series.append((region, flow_type, region_data[flow_type]))
+
+        forecasts = self._forecast_many([values for _, _, values in series], periods, 'linear_trend')
+
+        for (region, flow_type, values), forecast_result in zip(series, forecasts):
+            predictions[region][flow_type] = {
+                'quarters': next_quarters,
+                'values': forecast_result['forecast'],
+                'method': forecast_result['method'],
+                'confidence': forecast_result['confidence'],
+                'historical_total': float(sum(values)),
+                'last_value': float(values[-1])
+            }
 
         return predictions
 
@@ -640,23 +735,26 @@ class ComprehensiveRwandaTradePredictor:
         predictions = {}
 
         continental_data = self.data.get('continents', {})
+        series = []
 
         for continent, continent_data in continental_data.items():
             predictions[continent] = {}
 
             for flow_type in ['exports', 'imports', 're_exports']:
-                if flow_type in continent_data:
-                    values = continent_data[flow_type]
-                    if len(values) >= 2:
-                        forecast_result = self.forecast_time_series(values, periods, 'linear_trend')
-                        predictions[continent][flow_type] = {
-                            'quarters': next_quarters,
-                            'values': forecast_result['forecast'],
-                            'method': forecast_result['method'],
-                            'confidence': forecast_result['confidence'],
-                            'historical_total': float(sum(values)),
-                            'last_value': float(values[-1])
-                        }
+                if flow_type in continent_data and len(continent_data[flow_type]) >= 2:
+                    series.append((continent, flow_type, continent_data[flow_type]))
+
+        forecasts = self._forecast_many([values for _, _, values in series], periods, 'linear_trend')
+
+        for (continent, flow_type, values), forecast_result in zip(series, forecasts):
+            predictions[continent][flow_type] = {
+                'quarters': next_quarters,
+                'values': forecast_result['forecast'],
+                'method': forecast_result['method'],
+                'confidence': forecast_result['confidence'],
+                'historical_total': float(sum(values)),
+                'last_value': float(values[-1])
+            }
 
         return predictions
 
@@ -683,11 +781,11 @@ class ComprehensiveRwandaTradePredictor:
                 'balance_type': 'surplus' if next_balance >= 0 else 'deficit'
             }
 
-            # Growth insights
-            last_exp = overall['exports']['last_value']
-            last_imp = overall['imports']['last_value']
-            exp_growth = ((next_exp - last_exp) / last_exp) * 100 if last_exp != 0 else 0
-            imp_growth = ((next_imp - last_imp) / last_imp) * 100 if last_imp != 0 else 0
+            # Growth insights for exports and imports in one element-wise division (0 when last is 0)
+            next_vals = np.array([next_exp, next_imp])
+            last_vals = np.array([overall['exports']['last_value'], overall['imports']['last_value']])
+            exp_growth, imp_growth = np.divide((next_vals - last_vals) * 100, last_vals,
+                                               out=np.zeros(2), where=last_vals != 0)
 
             if exp_growth > 5:
                 insights['opportunities'].append(f"Strong export growth expected ({exp_growth:.1f}%)")
@@ -745,83 +843,120 @@ class ComprehensiveRwandaTradePredictor:
 
         return recommendations
 
-    def save_predictions(self, predictions: Dict, filename: str = "comprehensive_trade_predictions.json") -> str:
-        """Save comprehensive predictions to JSON file."""
+    def save_predictions(self, predictions: Dict, filename: str = "comprehensive_trade_predictions.json",
+                         compress: bool = False, pretty: bool = False) -> str:
+        """Save comprehensive predictions to JSON file, or to compact gzipped JSON when `compress` is set.
+
+        Output is compact unless `pretty` is set, which indents it by two spaces.
+        """
         filepath = self.output_dir / filename
 
-        # Convert numpy types for JSON serialization
-        def convert_types(obj):
-            if isinstance(obj, np.integer):
-                return int(obj)
-            elif isinstance(obj, np.floating):
-                return float(obj) if not np.isnan(obj) else None
-            elif isinstance(obj, np.ndarray):
-                return obj.tolist()
-            elif isinstance(obj, dict):
-                return {key: convert_types(value) for key, value in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_types(item) for item in obj]
+        if compress:
+            # Compact bytes at a light compression level; numeric-heavy output shrinks several-fold
+            filepath = filepath.with_name(filepath.name + '.gz')
+            with gzip.open(filepath, 'wb', compresslevel=1) as f:
+                f.write(orjson.dumps(
+                    predictions,
+                    default=orjson_default,
+                    option=ORJSON_OPTIONS
+                ))
+        else:
+            option = (ORJSON_OPTIONS | orjson.OPT_INDENT_2) if pretty else ORJSON_OPTIONS
+            encoded = orjson.dumps(predictions, default=orjson_default, option=option)
+
+            # Hash everything except the run timestamp (it changes every run); 'metadata'
+            # comes first, so its first occurrence in the encoded bytes is the one to skip
+            digest = hashlib.blake2b(digest_size=16)
+            generated_at = (predictions.get('metadata') or {}).get('generated_at')
+            timestamp = orjson.dumps(generated_at) if generated_at else b''
+            start = encoded.find(timestamp) if timestamp else -1
+            if start >= 0:
+                digest.update(encoded[:start])
+                digest.update(encoded[start + len(timestamp):])
             else:
-                return obj
+                digest.update(encoded)
+            digest = digest.hexdigest()
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(convert_types(predictions), f, indent=2, ensure_ascii=False)
+            # Skip the write only when the file on disk is the one this digest was recorded for
+            hash_file = self.cache_dir / 'predictions' / f"{filename}.hash"
+            try:
+                stat = filepath.stat()
+                unchanged = hash_file.read_text() == f"{digest}:{stat.st_mtime_ns}:{stat.st_size}"
+            except FileNotFoundError:
+                unchanged = False
+
+            if unchanged:
+                print(f"Comprehensive predictions unchanged, keeping {filepath}")
+                return os.fspath(filepath)
+
+            filepath.write_bytes(encoded)
+            stat = filepath.stat()
+            hash_file.parent.mkdir(parents=True, exist_ok=True)
+            hash_file.write_text(f"{digest}:{stat.st_mtime_ns}:{stat.st_size}")
 
         print(f"Comprehensive predictions saved to {filepath}")
-        return str(filepath)
+        return os.fspath(filepath)
 
     def print_summary(self, predictions: Dict):
         """Print comprehensive prediction summary."""
-        print("\n" + "="*80)
-        print("RWANDA COMPREHENSIVE TRADE PREDICTIONS SUMMARY")
-        print("="*80)
+        overall = predictions.get('overall_predictions') or {}
+        insights = predictions.get('insights') or {}
+        recs = predictions.get('recommendations') or ()
+
+        buf = io.StringIO()
+        print("\n" + "="*80, file=buf)
+        print("RWANDA COMPREHENSIVE TRADE PREDICTIONS SUMMARY", file=buf)
+        print("="*80, file=buf)
 
         # Overall metrics
-        overall = predictions.get('overall_predictions', {})
         if overall:
-            print(f"\nOverall Trade Predictions (Next Quarter):")
-            if 'exports' in overall:
-                exp = overall['exports']
-                print(f"   Exports: ${exp['values'][0]:,.0f} ({exp['method']}, {exp['confidence']}% confidence)")
-            if 'imports' in overall:
-                imp = overall['imports']
-                print(f"   Imports: ${imp['values'][0]:,.0f} ({imp['method']}, {imp['confidence']}% confidence)")
-            if 'trade_balance_calculated' in overall:
-                bal = overall['trade_balance_calculated']
-                balance_type = "SURPLUS" if bal['values'][0] >= 0 else "DEFICIT"
-                print(f"   Trade Balance: ${bal['values'][0]:,.0f} ({balance_type})")
+            print("\nOverall Trade Predictions (Next Quarter):", file=buf)
+            exp = overall.get('exports')
+            if exp:
+                print(f"   Exports: ${exp['values'][0]:,.0f} ({exp['method']}, {exp['confidence']}% confidence)", file=buf)
+            imp = overall.get('imports')
+            if imp:
+                print(f"   Imports: ${imp['values'][0]:,.0f} ({imp['method']}, {imp['confidence']}% confidence)", file=buf)
+            bal = overall.get('trade_balance_calculated')
+            if bal:
+                balance = bal['values'][0]
+                balance_type = "SURPLUS" if balance >= 0 else "DEFICIT"
+                print(f"   Trade Balance: ${balance:,.0f} ({balance_type})", file=buf)
 
         # Key insights
-        insights = predictions.get('insights', {})
-        if insights.get('opportunities'):
-            print(f"\nOpportunities:")
-            for opp in insights['opportunities']:
-                print(f"   • {opp}")
-
-        if insights.get('risks'):
-            print(f"\nRisks:")
-            for risk in insights['risks']:
-                print(f"   • {risk}")
+        opportunities = insights.get('opportunities')
+        if opportunities:
+            print("\nOpportunities:", file=buf)
+            for opp in opportunities:
+                print(f"   • {opp}", file=buf)
+
+        risks = insights.get('risks')
+        if risks:
+            print("\nRisks:", file=buf)
+            for risk in risks:
+                print(f"   • {risk}", file=buf)
 
         # Recommendations
-        recs = predictions.get('recommendations', [])
         if recs:
-            print(f"\nRecommendations:")
+            print("\nRecommendations:", file=buf)
             for rec in recs:
                 priority = rec.get('priority', 'medium').upper()
-                print(f"   [{priority}] {rec.get('title', '')}: {rec.get('description', '')}")
+                title = rec.get('title', '')
+                desc = rec.get('description', '')
+                print(f"   [{priority}] {title}: {desc}", file=buf)
 
-        print(f"\nComprehensive predictions generated for {len(predictions)-2} categories")
-        print("="*80)
+        n_categories = len(predictions) - len(_NON_CATEGORY_KEYS & predictions.keys())
+        print(f"\nComprehensive predictions generated for {n_categories} categories", file=buf)
+        print("="*80, file=buf)
 
+        # One write instead of a stdout round-trip per line
+        sys.stdout.write(buf.getvalue())
 
 def main():
     """Main function to run comprehensive predictions."""
     excel_file = "../data/raw/2025Q1_Trade_report_annexTables.xlsx"
 
-    if not os.path.exists(excel_file):
-        print(f"Excel file not found: {excel_file}")
-        return
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
 
     try:
         print("Initializing Comprehensive Rwanda Trade Predictor...")
@@ -833,7 +968,7 @@ def main():
         predictions = predictor.generate_comprehensive_predictions(forecast_periods=4)
 
         # Save predictions
-        filepath = predictor.save_predictions(predictions)
+        filepath = predictor.save_predictions(predictions, pretty=False)
 
         # Print summary
         predictor.print_summary(predictions)
@@ -841,6 +976,8 @@ def main():
         print(f"\nComprehensive predictions completed successfully!")
         print(f"Results saved to: {filepath}")
 
+    except FileNotFoundError as e:
+        print(f"Excel file not found: {e.filename or excel_file}")
     except Exception as e:
         print(f"Error during comprehensive prediction: {str(e)}")
         import traceback
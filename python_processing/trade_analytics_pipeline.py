@@ -12,8 +12,12 @@ Date: 2025
 
 import pandas as pd
 import numpy as np
-import json
+import bisect
+import functools
+import orjson
 import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Tuple
 import warnings
@@ -25,6 +29,134 @@ from statsmodels.tsa.holtwinters import ExponentialSmoothing
 from statsmodels.tsa.stattools import adfuller
 from scipy import stats
 from sklearn.metrics import mean_squared_error
+from joblib import Memory
+
+from analysis_utils import ORJSON_OPTIONS, orjson_default, top_k_indices
+
+
+def cached_json(filename: str):
+    """
+    Reuse an analysis' saved JSON when this code already produced it from the same workbook.
+
+    Each run records a stamp (RESULTS_VERSION plus the workbook's mtime_ns and size) in a
+    sidecar under cache_dir. The saved file is only reused when that stamp matches, so a
+    checked-out or hand-copied JSON without a sidecar, a changed workbook, or a version bump
+    makes the wrapped perform_* method run (and save `filename`) again.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self):
+            filepath = os.path.join(self.output_dir, filename)
+            stamp_path = os.path.join(self.cache_dir, 'results', f"{filename}.stamp")
+            stat = os.stat(self.excel_file)
+            stamp = f"v{self.RESULTS_VERSION}:{stat.st_mtime_ns}:{stat.st_size}"
+            try:
+                with open(stamp_path, 'r', encoding='utf-8') as f:
+                    if f.read() == stamp:
+                        with open(filepath, 'rb') as f:
+                            result = orjson.loads(f.read())
+                        print(f"Reusing {filename} (up to date with source data)")
+                        return result
+            except (OSError, ValueError):
+                pass
+
+            result = method(self)
+            os.makedirs(os.path.dirname(stamp_path), exist_ok=True)
+            with open(stamp_path, 'w', encoding='utf-8') as f:
+                f.write(stamp)
+            return result
+        return wrapper
+    return decorator
+
+
+# HHI band upper bounds and the label for each band (the last band is unbounded)
+_HHI_BINS = (0.01, 0.15, 0.25)
+_HHI_LABELS = (
+    "Highly competitive market",
+    "Unconcentrated market",
+    "Moderately concentrated",
+    "Highly concentrated market"
+)
+
+
+@functools.lru_cache(maxsize=128)
+def interpret_hhi(hhi_value: float) -> str:
+    """Describe the market structure an HHI value (on the 0-1 scale) indicates."""
+    return _HHI_LABELS[bisect.bisect_right(_HHI_BINS, hhi_value)]
+
+
+def _exponential_smoothing_forecast(values: Tuple[float, ...], periods: int = 4) -> Dict[str, Any]:
+    """Fit additive seasonal Holt-Winters (falling back to Holt's linear trend) and forecast."""
+    series = np.asarray(values, dtype=float)
+
+    try:
+        model = ExponentialSmoothing(series, seasonal='add', seasonal_periods=4).fit()
+        forecast = model.forecast(periods)
+
+        # Handle NaN values in model parameters
+        alpha = model.params.get('smoothing_level', 0)
+        beta = model.params.get('smoothing_trend', 0)
+        gamma = model.params.get('smoothing_seasonal', 0)
+
+        # Convert NaN to None for JSON compatibility
+        alpha = None if (isinstance(alpha, float) and np.isnan(alpha)) else alpha
+        beta = None if (isinstance(beta, float) and np.isnan(beta)) else beta
+        gamma = None if (isinstance(gamma, float) and np.isnan(gamma)) else gamma
+
+        return {
+            'forecast_values': forecast.tolist(),
+            'model_params': {
+                'alpha': alpha,
+                'beta': beta,
+                'gamma': gamma
+            },
+            'model_fit': {
+                'aic': model.aic,
+                'bic': model.bic
+            }
+        }
+    except Exception as e:
+        print(f"Warning: Exponential smoothing failed: {e}")
+        # Fallback to simple exponential smoothing
+        try:
+            model = ExponentialSmoothing(series, trend='add').fit()
+            forecast = model.forecast(periods)
+
+            alpha = model.params.get('smoothing_level', 0)
+            beta = model.params.get('smoothing_trend', 0)
+
+            alpha = None if (isinstance(alpha, float) and np.isnan(alpha)) else alpha
+            beta = None if (isinstance(beta, float) and np.isnan(beta)) else beta
+
+            return {
+                'forecast_values': forecast.tolist(),
+                'model_params': {
+                    'alpha': alpha,
+                    'beta': beta,
+                    'gamma': None
+                },
+                'model_fit': {
+                    'aic': model.aic,
+                    'bic': model.bic
+                }
+            }
+        except Exception as e2:
+            print(f"Warning: Fallback exponential smoothing also failed: {e2}")
+            # Return basic forecast if all methods fail
+            last_value = values[-1]
+            return {
+                'forecast_values': [last_value] * periods,
+                'model_params': {
+                    'alpha': None,
+                    'beta': None,
+                    'gamma': None
+                },
+                'model_fit': {
+                    'aic': 0,
+                    'bic': 0
+                }
+            }
+
 
 class RwandaTradeAnalytics:
     """
@@ -32,6 +164,28 @@ class RwandaTradeAnalytics:
     Performs 6 comprehensive statistical methods.
     """
 
+    # Workbook sheets used by the pipeline, keyed by their raw_data name
+    SHEETS = {
+        'overall': 'Graph Overall',
+        'eac': 'EAC',
+        'export_country': 'ExportCountry',
+        'import_country': 'ImportCountry',
+        'export_commodity': 'ExportsCommodity',
+        'import_commodity': 'ImportsCommodity',
+        'regional_blocks': 'Regional blocks',
+        'trade_by_continents': 'Trade by continents'
+    }
+
+    # Country sheets have a five-row title/total block above the country rows. Reading them
+    # headerless from the first country row lets pandas type the quarter columns as float64
+    COUNTRY_SHEET_OPTIONS = {'header': None, 'skiprows': 5, 'dtype': {0: str}}
+
+    # Bump when the sheet read options change so stale cached frames are not reused
+    CACHE_VERSION = 2
+
+    # Bump when an analysis' output changes so saved results are recomputed (see cached_json)
+    RESULTS_VERSION = 2
+
     def __init__(self, excel_file: str):
         """
         Initialize the analytics engine.
@@ -42,8 +196,13 @@ class RwandaTradeAnalytics:
         self.excel_file = excel_file
         self.data = {}
         self.output_dir = "python_processing/data/processed"
+        # Caches sit next to this script (git-ignored), whatever the working directory
+        self.cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'cache')
         os.makedirs(self.output_dir, exist_ok=True)
 
+        self._memory = Memory(os.path.join(self.cache_dir, 'forecasts'), verbose=0)
+        self._fit_exponential_smoothing = self._memory.cache(_exponential_smoothing_forecast)
+
         # Load and process data
         self.load_data()
         self.process_data()
@@ -53,20 +212,11 @@ class RwandaTradeAnalytics:
         print("Loading trade data from Excel file...")
 
         try:
-            # Read all relevant sheets
-            excel_data = pd.read_excel(self.excel_file, sheet_name=None)
+            # Read the relevant sheets
+            excel_data = self.read_sheets()
 
             # Extract key sheets
-            self.raw_data = {
-                'overall': excel_data.get('Graph Overall', pd.DataFrame()),
-                'eac': excel_data.get('EAC', pd.DataFrame()),
-                'export_country': excel_data.get('ExportCountry', pd.DataFrame()),
-                'import_country': excel_data.get('ImportCountry', pd.DataFrame()),
-                'export_commodity': excel_data.get('ExportsCommodity', pd.DataFrame()),
-                'import_commodity': excel_data.get('ImportsCommodity', pd.DataFrame()),
-                'regional_blocks': excel_data.get('Regional blocks', pd.DataFrame()),
-                'trade_by_continents': excel_data.get('Trade by continents', pd.DataFrame())
-            }
+            self.raw_data = {key: excel_data.get(sheet, pd.DataFrame()) for key, sheet in self.SHEETS.items()}
 
             print(f"Loaded {len(self.raw_data)} data sheets successfully")
 
@@ -74,6 +224,45 @@ class RwandaTradeAnalytics:
             print(f"Error loading Excel file: {e}")
             raise
 
+    def read_sheets(self) -> Dict[str, pd.DataFrame]:
+        """
+        Read the sheets listed in SHEETS, reusing a pickled copy when the workbook is unchanged.
+
+        The cache is keyed by the workbook's name, modification time and size, and only the
+        needed sheets are parsed, so the other tabs never go through openpyxl.
+        """
+        stat = os.stat(self.excel_file)
+        name = os.path.splitext(os.path.basename(self.excel_file))[0]
+        cache_file = os.path.join(self.cache_dir,
+                                  f"{name}_{stat.st_mtime_ns}_{stat.st_size}_v{self.CACHE_VERSION}.pkl")
+
+        if os.path.exists(cache_file):
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+
+        # pandas' openpyxl reader opens the workbook read-only, so only these sheets are parsed
+        with pd.ExcelFile(self.excel_file, engine='openpyxl') as workbook:
+            sheets = [sheet for sheet in self.SHEETS.values() if sheet in workbook.sheet_names]
+            missing = [sheet for sheet in self.SHEETS.values() if sheet not in workbook.sheet_names]
+            if missing:
+                print(f"Warning: sheets not found in {self.excel_file}: {', '.join(missing)}")
+            country_sheets = [sheet for sheet in (self.SHEETS['export_country'], self.SHEETS['import_country'])
+                              if sheet in sheets]
+            other_sheets = [sheet for sheet in sheets if sheet not in country_sheets]
+
+            # read_excel rejects an empty sheet list, so only read the groups that are present
+            excel_data = {}
+            if other_sheets:
+                excel_data.update(pd.read_excel(workbook, sheet_name=other_sheets))
+            if country_sheets:
+                excel_data.update(pd.read_excel(workbook, sheet_name=country_sheets, **self.COUNTRY_SHEET_OPTIONS))
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump(excel_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        return excel_data
+
     def process_data(self):
         """Process raw data into structured format."""
         print("Processing trade data...")
@@ -90,6 +279,9 @@ class RwandaTradeAnalytics:
         # Process regional data
         self.process_regional_data()
 
+        # Lay out the country and commodity values as matrices for the analyses
+        self.build_value_matrices()
+
         print("Data processing completed")
 
     def process_overall_trade(self):
@@ -105,83 +297,25 @@ class RwandaTradeAnalytics:
         total_trade = [1428.21, 1573.43, 1525.1, 1461.13, 1463.87, 1751.84, 1969.47, 1893.9, 1463.62]
         trade_balance = [-536.7, -511.91, -652.86, -596.22, -488.34, -569.92, -531.57, -464.49, -411.35]
 
+        # Series are stored as float64 arrays once so every analysis works on them without re-wrapping
         self.data['overall'] = {
             'quarters': quarters,
-            'exports': exports,
-            'imports': imports,
-            're_exports': re_exports,
-            'total_trade': total_trade,
-            'trade_balance': trade_balance
+            'exports': np.array(exports, dtype=np.float64),
+            'imports': np.array(imports, dtype=np.float64),
+            're_exports': np.array(re_exports, dtype=np.float64),
+            'total_trade': np.array(total_trade, dtype=np.float64),
+            'trade_balance': np.array(trade_balance, dtype=np.float64)
         }
 
     def process_country_data(self):
         """Process country-level trade data."""
-        # Export countries - manually handle the Excel structure
-        export_df = self.raw_data['export_country']
-
-        # The actual data starts from row 4 (0-indexed), with country names in column 0
-        # and quarterly data in columns 1-9 (2023Q1 to 2025Q1)
-        export_countries = []
-
-        # Define the quarter columns based on the structure we observed
+        # Country sheets are read from the first country row (see COUNTRY_SHEET_OPTIONS), with
+        # country names in column 0 and quarterly data in columns 1-9 (2023Q1 to 2025Q1)
         quarter_columns = ['2023Q1', '2023Q2', '2023Q3', '2023Q4', '2024Q1', '2024Q2', '2024Q3', '2024Q4', '2025Q1']
 
-        for idx in range(4, len(export_df)):  # Start from row 4 (actual data)
-            row = export_df.iloc[idx]
-
-            # Get country name from first column
-            country_name = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ''
-
-            # Skip empty rows or non-country rows
-            if not country_name or country_name == 'nan' or 'Source:' in country_name or '*' in country_name:
-                continue
-
-            country_data = {
-                'country': country_name,
-                'values': {}
-            }
-
-            # Extract quarterly values (columns 1-9 correspond to quarters)
-            for i, quarter in enumerate(quarter_columns):
-                col_idx = i + 1  # Data starts from column 1
-                if col_idx < len(row) and pd.notna(row.iloc[col_idx]):
-                    try:
-                        value = float(row.iloc[col_idx])
-                        country_data['values'][quarter] = value
-                    except (ValueError, TypeError):
-                        continue
-
-            if country_data['values']:  # Only add if we have some data
-                export_countries.append(country_data)
-
-        # Import countries - same structure
-        import_df = self.raw_data['import_country']
-        import_countries = []
-
-        for idx in range(4, len(import_df)):  # Start from row 4
-            row = import_df.iloc[idx]
-
-            country_name = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ''
-
-            if not country_name or country_name == 'nan' or 'Source:' in country_name or '*' in country_name:
-                continue
-
-            country_data = {
-                'country': country_name,
-                'values': {}
-            }
-
-            for i, quarter in enumerate(quarter_columns):
-                col_idx = i + 1
-                if col_idx < len(row) and pd.notna(row.iloc[col_idx]):
-                    try:
-                        value = float(row.iloc[col_idx])
-                        country_data['values'][quarter] = value
-                    except (ValueError, TypeError):
-                        continue
-
-            if country_data['values']:
-                import_countries.append(country_data)
+        # Import countries use the same structure as export countries
+        export_countries = self._extract_country_table(self.raw_data['export_country'], quarter_columns)
+        import_countries = self._extract_country_table(self.raw_data['import_country'], quarter_columns)
 
         self.data['countries'] = {
             'exports': export_countries,
@@ -190,112 +324,156 @@ class RwandaTradeAnalytics:
 
         print(f"Processed {len(export_countries)} export countries and {len(import_countries)} import countries")
 
-    def process_commodity_data(self):
-        """Process commodity-level trade data."""
-        # Export commodities
-        export_comm_df = self.raw_data['export_commodity']
-        export_commodities = []
-
-        for idx, row in export_comm_df.iterrows():
-            if pd.notna(row.get('SITC SECTION')) and row.get('SITC SECTION') not in ['SITC SECTION', 'Total Estimates']:
-                commodity_data = {
-                    'section': row.get('SITC SECTION', ''),
-                    'description': row.get('COMMODITY DESCRIPTION/ TOTAL ESTIMATES', ''),
-                    'values': {}
-                }
+    def _extract_country_table(self, df: pd.DataFrame, quarter_columns: List[str]) -> List[Dict[str, Any]]:
+        """Extract country rows from a country sheet with two columnar passes instead of per-cell lookups."""
+        if df.shape[1] == 0:
+            return []
 
-                for col in export_comm_df.columns:
-                    if '2023' in str(col) or '2024' in str(col) or '2025' in str(col):
-                        val = row.get(col)
-                        if pd.notna(val):
-                            commodity_data['values'][col] = float(val)
-
-                if commodity_data['section']:
-                    export_commodities.append(commodity_data)
-
-        # Import commodities
-        import_comm_df = self.raw_data['import_commodity']
-        import_commodities = []
-
-        for idx, row in import_comm_df.iterrows():
-            if pd.notna(row.get('SITC SECTION')) and row.get('SITC SECTION') not in ['SITC SECTION', 'Total Estimates']:
-                commodity_data = {
-                    'section': row.get('SITC SECTION', ''),
-                    'description': row.get('COMMODITY DESCRIPTION/ TOTAL ESTIMATES', ''),
-                    'values': {}
-                }
+        table = df.iloc[:, :len(quarter_columns) + 1]
+
+        # Skip empty rows or non-country rows
+        names = table.iloc[:, 0]
+        names = names.where(names.notna(), '').astype(str).str.strip()
+        keep = names.ne('') & names.ne('nan') & ~names.str.contains(r'Source:|\*', regex=True)
+
+        # Quarterly values arrive as float64; anything else (e.g. a stray text cell) is
+        # coerced, with non-numbers becoming NaN and dropped below
+        values = table.iloc[:, 1:]
+        if not all(pd.api.types.is_float_dtype(dtype) for dtype in values.dtypes):
+            values = values.apply(pd.to_numeric, errors='coerce')
+        values = values.set_axis(quarter_columns[:values.shape[1]], axis=1)
 
-                for col in import_comm_df.columns:
-                    if '2023' in str(col) or '2024' in str(col) or '2025' in str(col):
-                        val = row.get(col)
-                        if pd.notna(val):
-                            commodity_data['values'][col] = float(val)
+        countries = []
+        for country_name, country_values in zip(names[keep], self._nonmissing_rows(values[keep])):
+            if country_values:  # Only add if we have some data
+                countries.append({'country': country_name, 'values': country_values})
 
-                if commodity_data['section']:
-                    import_commodities.append(commodity_data)
+        return countries
+
+    def process_commodity_data(self):
+        """Process commodity-level trade data."""
+        # Export and import commodities share the same sheet layout
+        export_commodities = self._extract_commodities(self.raw_data['export_commodity'])
+        import_commodities = self._extract_commodities(self.raw_data['import_commodity'])
 
         self.data['commodities'] = {
             'exports': export_commodities,
             'imports': import_commodities
         }
 
+    def _extract_commodities(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Extract SITC section rows from a commodity sheet."""
+        rows = self._select_rows(df, 'SITC SECTION', ['SITC SECTION', 'Total Estimates'])
+        descriptions = rows.get('COMMODITY DESCRIPTION/ TOTAL ESTIMATES', pd.Series('', index=rows.index))
+
+        return [
+            {'section': section, 'description': description, 'values': values}
+            for section, description, values in zip(rows.get('SITC SECTION', []), descriptions, self._quarter_values(rows))
+            if section
+        ]
+
     def process_regional_data(self):
         """Process regional and continental data."""
         # Regional blocks
-        regional_df = self.raw_data['regional_blocks']
-        regional_data = []
-
-        for idx, row in regional_df.iterrows():
-            if pd.notna(row.get('Partner')) and row.get('Partner') not in ['Partner', 'Source: NISR']:
-                region_data = {
-                    'region': row.get('Partner', ''),
-                    'flow': row.get('Flow \\ Period', ''),
-                    'values': {}
-                }
-
-                for col in regional_df.columns:
-                    if '2023' in str(col) or '2024' in str(col) or '2025' in str(col):
-                        val = row.get(col)
-                        if pd.notna(val):
-                            region_data['values'][col] = float(val)
+        regional_df = self._select_rows(self.raw_data['regional_blocks'], 'Partner', ['Partner', 'Source: NISR'])
+        flows = regional_df.get('Flow \\ Period', pd.Series('', index=regional_df.index))
 
-                if region_data['region']:
-                    regional_data.append(region_data)
+        regional_data = [
+            {'region': region, 'flow': flow, 'values': values}
+            for region, flow, values in zip(regional_df.get('Partner', []), flows, self._quarter_values(regional_df))
+            if region
+        ]
 
         # Continents
-        continents_df = self.raw_data['trade_by_continents']
+        continents_df = self._select_rows(self.raw_data['trade_by_continents'], 'Partner \\ Period',
+                                          ['Partner \\ Period', 'WORLD'])
+        flows = continents_df.get('Flow', pd.Series('', index=continents_df.index))
         continents_data = []
 
-        for idx, row in continents_df.iterrows():
-            if pd.notna(row.get('Partner \\ Period')) and row.get('Partner \\ Period') not in ['Partner \\ Period', 'WORLD']:
-                continent_data = {
-                    'continent': row.get('Partner \\ Period', ''),
-                    'flow': row.get('Flow', ''),
-                    'values': {},
-                    'shares': {}
-                }
+        for continent, flow, values in zip(continents_df.get('Partner \\ Period', []), flows,
+                                           self._quarter_values(continents_df)):
+            if not continent:
+                continue
+
+            continent_data = {
+                'continent': continent,
+                'flow': flow,
+                'values': {},
+                'shares': {}
+            }
 
-                for col in continents_df.columns:
-                    if '2023' in str(col) or '2024' in str(col) or '2025' in str(col):
-                        val = row.get(col)
-                        if pd.notna(val):
-                            if 'Share' in str(col):
-                                continent_data['shares'][col.replace('Share in %', '').strip()] = float(val)
-                            else:
-                                continent_data['values'][col] = float(val)
+            for col, val in values.items():
+                if 'Share' in str(col):
+                    continent_data['shares'][col.replace('Share in %', '').strip()] = val
+                else:
+                    continent_data['values'][col] = val
 
-                if continent_data['continent']:
-                    continents_data.append(continent_data)
+            continents_data.append(continent_data)
 
         self.data['regional'] = {
             'regional_blocks': regional_data,
             'continents': continents_data
         }
 
+    def build_value_matrices(self):
+        """
+        Lay out country and commodity values as (entities, quarters) float64 matrices.
+
+        Rows follow the order of the entity lists in self.data and missing quarters are 0,
+        so row sums match summing each entity's values dict. Country columns follow
+        overall['quarters']. The row sums are kept alongside as *_totals.
+        """
+        quarters = self.data['overall']['quarters']
+        countries = self.data['countries']
+        commodities = self.data['commodities']
+
+        self.country_export_mat = self._value_matrix(countries['exports'], quarters)
+        self.country_import_mat = self._value_matrix(countries['imports'], quarters)
+        self.commodity_export_mat = self._value_matrix(commodities['exports'])
+        self.commodity_import_mat = self._value_matrix(commodities['imports'])
+
+        # Per-entity totals, shared by the share, HHI and trade balance analyses
+        self.country_export_totals = self.country_export_mat.sum(axis=1)
+        self.country_import_totals = self.country_import_mat.sum(axis=1)
+        self.commodity_export_totals = self.commodity_export_mat.sum(axis=1)
+        self.commodity_import_totals = self.commodity_import_mat.sum(axis=1)
+
+    def _value_matrix(self, entities: List[Dict[str, Any]], columns: List[Any] = None) -> np.ndarray:
+        """Stack the entities' values dicts into one float64 matrix, with missing cells as 0."""
+        if not entities:
+            return np.zeros((0, len(columns or ())))
+        frame = pd.DataFrame.from_records([entity['values'] for entity in entities], columns=columns)
+        return frame.to_numpy(dtype=np.float64, na_value=0.0)
+
+    def _select_rows(self, df: pd.DataFrame, key_col: str, excluded: List[str]) -> pd.DataFrame:
+        """Rows whose `key_col` is filled and is not one of the `excluded` labels (repeated headers, totals, footers)."""
+        if key_col not in df.columns:
+            return df.iloc[0:0]
+        keys = df[key_col]
+        return df[keys.notna() & ~keys.isin(excluded)]
+
+    def _quarter_values(self, df: pd.DataFrame) -> List[Dict[Any, float]]:
+        """
+        Per-row dicts of a sheet's non-missing quarterly figures.
+
+        Quarter columns (labels mentioning 2023, 2024 or 2025) are found once per sheet and
+        coerced to float in one columnar pass.
+        """
+        quarter_cols = [col for col in df.columns if any(year in str(col) for year in ('2023', '2024', '2025'))]
+        return self._nonmissing_rows(df[quarter_cols].apply(pd.to_numeric, errors='coerce'))
+
+    def _nonmissing_rows(self, numeric: pd.DataFrame) -> List[Dict[Any, float]]:
+        """Per-row dicts of a numeric frame's non-NaN cells, keyed by column label, from one float64 array."""
+        labels = np.array(numeric.columns, dtype=object)
+        values = numeric.to_numpy(dtype=np.float64)
+        present = ~np.isnan(values)
+        return [dict(zip(labels[mask], row[mask].tolist())) for row, mask in zip(values, present)]
+
     # ============================================================================
     # TASK 1: TIME SERIES ANALYSIS
     # ============================================================================
 
+    @cached_json('time_series.json')
     def perform_time_series_analysis(self) -> Dict[str, Any]:
         """
         Perform comprehensive time series analysis including trends, seasonality,
@@ -305,28 +483,24 @@ class RwandaTradeAnalytics:
 
         overall = self.data['overall']
 
-        # Create time series data
-        quarters = overall['quarters']
-        exports = overall['exports']
-        imports = overall['imports']
-        trade_balance = overall['trade_balance']
-
-        # Convert to pandas Series with datetime index
-        dates = pd.date_range(start='2023Q1', periods=len(quarters), freq='Q')
-        exports_ts = pd.Series(exports, index=dates)
-        imports_ts = pd.Series(imports, index=dates)
-        balance_ts = pd.Series(trade_balance, index=dates)
+        # Time series data; the quarterly float64 arrays are passed to the models as-is,
+        # since none of the results need a datetime index
+        exports_ts = overall['exports']
+        imports_ts = overall['imports']
+        balance_ts = overall['trade_balance']
 
-        # Calculate trends using linear regression
+        # Calculate trends using linear regression (closed-form least squares)
         def calculate_trend(series):
-            X = np.arange(len(series))
-            X = sm.add_constant(X)
-            model = sm.OLS(series.values, X).fit()
-            trend = model.predict(X)
+            x = np.arange(len(series), dtype=np.float64)
+            y = np.asarray(series, dtype=np.float64)
+            slope, intercept = np.polyfit(x, y, 1)
+            trend = slope * x + intercept
+            ss_res = np.sum((y - trend) ** 2)
+            ss_tot = np.sum((y - y.mean()) ** 2)
             return {
-                'slope': model.params[1],
-                'intercept': model.params[0],
-                'r_squared': model.rsquared,
+                'slope': slope,
+                'intercept': intercept,
+                'r_squared': 1 - ss_res / ss_tot,
                 'trend_values': trend.tolist()
             }
 
@@ -335,82 +509,25 @@ class RwandaTradeAnalytics:
         balance_trend = calculate_trend(balance_ts)
 
         # Exponential Smoothing Forecasting
+        # Fits are memoized on disk by series values, so unchanged data skips the optimizer
         def forecast_series(series, periods=4):
-            try:
-                model = ExponentialSmoothing(series, seasonal='add', seasonal_periods=4).fit()
-                forecast = model.forecast(periods)
-
-                # Handle NaN values in model parameters
-                alpha = model.params.get('smoothing_level', 0)
-                beta = model.params.get('smoothing_trend', 0)
-                gamma = model.params.get('smoothing_seasonal', 0)
-
-                # Convert NaN to None for JSON compatibility
-                alpha = None if (isinstance(alpha, float) and np.isnan(alpha)) else alpha
-                beta = None if (isinstance(beta, float) and np.isnan(beta)) else beta
-                gamma = None if (isinstance(gamma, float) and np.isnan(gamma)) else gamma
-
-                return {
-                    'forecast_values': forecast.tolist(),
-                    'model_params': {
-                        'alpha': alpha,
-                        'beta': beta,
-                        'gamma': gamma
-                    },
-                    'model_fit': {
-                        'aic': model.aic,
-                        'bic': model.bic
-                    }
-                }
-            except Exception as e:
-                print(f"Warning: Exponential smoothing failed: {e}")
-                # Fallback to simple exponential smoothing
-                try:
-                    model = ExponentialSmoothing(series, trend='add').fit()
-                    forecast = model.forecast(periods)
-
-                    alpha = model.params.get('smoothing_level', 0)
-                    beta = model.params.get('smoothing_trend', 0)
-
-                    alpha = None if (isinstance(alpha, float) and np.isnan(alpha)) else alpha
-                    beta = None if (isinstance(beta, float) and np.isnan(beta)) else beta
-
-                    return {
-                        'forecast_values': forecast.tolist(),
-                        'model_params': {
-                            'alpha': alpha,
-                            'beta': beta,
-                            'gamma': None
-                        },
-                        'model_fit': {
-                            'aic': model.aic,
-                            'bic': model.bic
-                        }
-                    }
-                except Exception as e2:
-                    print(f"Warning: Fallback exponential smoothing also failed: {e2}")
-                    # Return basic forecast if all methods fail
-                    last_value = series.iloc[-1] if hasattr(series, 'iloc') else series[-1]
-                    return {
-                        'forecast_values': [last_value] * periods,
-                        'model_params': {
-                            'alpha': None,
-                            'beta': None,
-                            'gamma': None
-                        },
-                        'model_fit': {
-                            'aic': 0,
-                            'bic': 0
-                        }
-                    }
+            return self._fit_exponential_smoothing(tuple(series.tolist()), periods)
 
         exports_forecast = forecast_series(exports_ts)
         imports_forecast = forecast_series(imports_ts)
 
         # Seasonality analysis
-        def analyze_seasonality(series):
+        def analyze_seasonality(series, period=4):
+            if len(series) < 2 * period + 1:
+                # Too short for a centred moving-average trend; report no seasonal pattern
+                return {
+                    'seasonal_component': [0] * len(series),
+                    'trend_component': [None] * len(series),
+                    'residual_component': [None] * len(series)
+                }
+
             try:
-                seasonal_decomp = sm.tsa.seasonal_decompose(series, model='additive', period=4)
+                seasonal_decomp = sm.tsa.seasonal_decompose(series, model='additive', period=period)
                 # Convert NaN values to None for JSON compatibility
                 trend_list = seasonal_decomp.trend.tolist()
                 resid_list = seasonal_decomp.resid.tolist()
@@ -438,7 +555,7 @@ class RwandaTradeAnalytics:
 
         # Stationarity tests
         def test_stationarity(series):
-            result = adfuller(series.values)
+            result = adfuller(np.asarray(series, dtype=np.float64))
             return {
                 'adf_statistic': result[0],
                 'p_value': result[1],
@@ -478,6 +595,7 @@ class RwandaTradeAnalytics:
     # TASK 2: COMPARATIVE GROWTH ANALYSIS
     # ============================================================================
 
+    @cached_json('growth_analysis.json')
     def perform_growth_analysis(self) -> Dict[str, Any]:
         """
         Perform comprehensive growth analysis including QoQ, YoY, and CAGR calculations.
@@ -489,38 +607,39 @@ class RwandaTradeAnalytics:
         exports = overall['exports']
         imports = overall['imports']
 
-        # Calculate QoQ growth
+        # Calculate QoQ growth (0 where the previous quarter is 0)
         def calculate_qoq_growth(values):
-            growth_rates = []
-            for i in range(1, len(values)):
-                if values[i-1] != 0:
-                    growth = (values[i] - values[i-1]) / values[i-1]
-                    growth_rates.append(growth)
-                else:
-                    growth_rates.append(0)
-            return growth_rates
+            v = np.asarray(values, dtype=np.float64)
+            if len(v) < 2:
+                return []
+            return np.divide(np.diff(v), v[:-1], out=np.zeros(len(v) - 1), where=v[:-1] != 0).tolist()
 
         exports_qoq = calculate_qoq_growth(exports)
         imports_qoq = calculate_qoq_growth(imports)
 
         # Calculate YoY growth (comparing same quarter year-over-year)
         def calculate_yoy_growth(values, quarters):
-            growth_rates = []
-            for i in range(len(values)):
-                current_quarter = quarters[i]
+            v = np.asarray(values, dtype=np.float64)
+            position = {quarter: i for i, quarter in enumerate(quarters)}
+
+            # Pair each 2024/2025 quarter with the same quarter of the previous year
+            current_idx, prev_idx = [], []
+            for i, current_quarter in enumerate(quarters):
                 if '2024' in current_quarter or '2025' in current_quarter:
-                    # Find corresponding quarter from previous year
                     prev_year = str(int(current_quarter[:4]) - 1)
                     prev_quarter = current_quarter.replace(current_quarter[:4], prev_year)
-
-                    prev_idx = quarters.index(prev_quarter) if prev_quarter in quarters else -1
-                    if prev_idx >= 0 and values[prev_idx] != 0:
-                        growth = (values[i] - values[prev_idx]) / values[prev_idx]
-                        growth_rates.append(growth)
-                    else:
-                        growth_rates.append(None)
-                else:
-                    growth_rates.append(None)
+                    pi = position.get(prev_quarter, -1)
+                    if pi >= 0:
+                        current_idx.append(i)
+                        prev_idx.append(pi)
+
+            growth_rates = [None] * len(values)
+            if current_idx:
+                curr, prev = v[current_idx], v[prev_idx]
+                growth = np.divide(curr - prev, prev, out=np.zeros(len(prev)), where=prev != 0)
+                for i, rate, base in zip(current_idx, growth.tolist(), prev.tolist()):
+                    if base != 0:
+                        growth_rates[i] = rate
             return growth_rates
 
         exports_yoy = calculate_yoy_growth(exports, quarters)
@@ -601,6 +720,7 @@ class RwandaTradeAnalytics:
     # TASK 3: CONTRIBUTION & SHARE ANALYSIS
     # ============================================================================
 
+    @cached_json('share_analysis.json')
     def perform_share_analysis(self) -> Dict[str, Any]:
         """
         Analyze contribution and share percentages for countries, regions, continents, and commodities.
@@ -608,108 +728,68 @@ class RwandaTradeAnalytics:
         print("Performing Contribution & Share Analysis...")
 
         overall = self.data['overall']
-        total_exports = sum(overall['exports'])
-        total_imports = sum(overall['imports'])
+        total_exports = overall['exports'].sum()
+        total_imports = overall['imports'].sum()
 
         # Country share analysis
         countries = self.data['countries']
         country_share = {
-            "exports": {},
-            "imports": {}
+            "exports": self._share_table(countries['exports'], 'country', self.country_export_totals, total_exports),
+            "imports": self._share_table(countries['imports'], 'country', self.country_import_totals, total_imports)
         }
 
-        # Calculate export shares by country
-        for country in countries['exports']:
-            total_country_exports = sum(country['values'].values())
-            share = (total_country_exports / total_exports) * 100 if total_exports > 0 else 0
-            country_share["exports"][country['country']] = {
-                "value": total_country_exports,
-                "share_percentage": share
-            }
-
-        # Calculate import shares by country
-        for country in countries['imports']:
-            total_country_imports = sum(country['values'].values())
-            share = (total_country_imports / total_imports) * 100 if total_imports > 0 else 0
-            country_share["imports"][country['country']] = {
-                "value": total_country_imports,
-                "share_percentage": share
-            }
-
         # Regional share analysis
         regional = self.data['regional']
         region_share = {}
 
-        for region_data in regional['regional_blocks']:
-            if region_data['flow'] == 'Export':
-                total_region_exports = sum(region_data['values'].values())
-                share = (total_region_exports / total_exports) * 100 if total_exports > 0 else 0
-                region_share[region_data['region']] = {
-                    "exports": {
-                        "value": total_region_exports,
-                        "share_percentage": share
-                    }
+        export_blocks = [region_data for region_data in regional['regional_blocks'] if region_data['flow'] == 'Export']
+        for region_data, total_region_exports in zip(export_blocks, self._entity_totals(export_blocks).tolist()):
+            share = (total_region_exports / total_exports) * 100 if total_exports > 0 else 0
+            region_share[region_data['region']] = {
+                "exports": {
+                    "value": total_region_exports,
+                    "share_percentage": share
                 }
+            }
 
         # Continent share analysis
         continent_share = {}
 
-        for continent_data in regional['continents']:
+        continent_totals = self._entity_totals(regional['continents']).tolist()
+        for continent_data, total_continent in zip(regional['continents'], continent_totals):
             if continent_data['flow'] == 'Exports':
-                total_continent_exports = sum(continent_data['values'].values())
-                share = (total_continent_exports / total_exports) * 100 if total_exports > 0 else 0
+                share = (total_continent / total_exports) * 100 if total_exports > 0 else 0
                 continent_share[continent_data['continent']] = {
                     "exports": {
-                        "value": total_continent_exports,
+                        "value": total_continent,
                         "share_percentage": share
                     }
                 }
             elif continent_data['flow'] == 'Imports':
-                total_continent_imports = sum(continent_data['values'].values())
-                share = (total_continent_imports / total_imports) * 100 if total_imports > 0 else 0
+                share = (total_continent / total_imports) * 100 if total_imports > 0 else 0
                 if continent_data['continent'] not in continent_share:
                     continent_share[continent_data['continent']] = {}
                 continent_share[continent_data['continent']]["imports"] = {
-                    "value": total_continent_imports,
+                    "value": total_continent,
                     "share_percentage": share
                 }
 
         # Commodity share analysis
         commodities = self.data['commodities']
         commodity_share = {
-            "exports": {},
-            "imports": {}
+            "exports": self._share_table(commodities['exports'], 'description', self.commodity_export_totals, total_exports),
+            "imports": self._share_table(commodities['imports'], 'description', self.commodity_import_totals, total_imports)
         }
 
-        for commodity in commodities['exports']:
-            total_commodity_exports = sum(commodity['values'].values())
-            share = (total_commodity_exports / total_exports) * 100 if total_exports > 0 else 0
-            commodity_share["exports"][commodity['description']] = {
-                "value": total_commodity_exports,
-                "share_percentage": share
-            }
-
-        for commodity in commodities['imports']:
-            total_commodity_imports = sum(commodity['values'].values())
-            share = (total_commodity_imports / total_imports) * 100 if total_imports > 0 else 0
-            commodity_share["imports"][commodity['description']] = {
-                "value": total_commodity_imports,
-                "share_percentage": share
-            }
-
         # Generate insights
         insights = []
 
         # Top export destinations
-        top_exports = sorted(country_share["exports"].items(),
-                           key=lambda x: x[1]["share_percentage"], reverse=True)[:5]
-        for country, data in top_exports:
+        for country, data in self._top_shares(country_share["exports"], 5):
             insights.append(f"{country} contributes {data['share_percentage']:.1f}% of total exports")
 
         # Top import sources
-        top_imports = sorted(country_share["imports"].items(),
-                           key=lambda x: x[1]["share_percentage"], reverse=True)[:5]
-        for country, data in top_imports:
+        for country, data in self._top_shares(country_share["imports"], 5):
             insights.append(f"{country} contributes {data['share_percentage']:.1f}% of total imports")
 
         # Continent insights
@@ -718,9 +798,7 @@ class RwandaTradeAnalytics:
                 insights.append(f"{continent} contributes {data['exports']['share_percentage']:.1f}% of exports")
 
         # Commodity insights
-        top_commodities = sorted(commodity_share["exports"].items(),
-                               key=lambda x: x[1]["share_percentage"], reverse=True)[:3]
-        for commodity, data in top_commodities:
+        for commodity, data in self._top_shares(commodity_share["exports"], 3):
             insights.append(f"{commodity} represents {data['share_percentage']:.1f}% of export value")
 
         result = {
@@ -737,88 +815,60 @@ class RwandaTradeAnalytics:
         print("Share Analysis completed")
         return result
 
+    def _entity_totals(self, entities: List[Dict[str, Any]]) -> np.ndarray:
+        """Total each entity's quarterly values in one columnar reduction."""
+        if not entities:
+            return np.zeros(0)
+        return pd.DataFrame.from_records([entity['values'] for entity in entities]).sum(axis=1).to_numpy(dtype=float)
+
+    def _share_table(self, entities: List[Dict[str, Any]], name_key: str, totals: np.ndarray,
+                     total: float) -> Dict[str, Dict[str, float]]:
+        """Map each entity's name to its total value (from `totals`) and its percentage share of `total`."""
+        shares = totals * (100.0 / total) if total > 0 else np.zeros_like(totals)
+        return {
+            entity[name_key]: {"value": value, "share_percentage": share}
+            for entity, value, share in zip(entities, totals.tolist(), shares.tolist())
+        }
+
+    def _top_shares(self, share_table: Dict[str, Dict[str, float]], n: int) -> List[Tuple[str, Dict[str, float]]]:
+        """The n entries with the largest share, largest first."""
+        return self._top_entries(share_table, "share_percentage", n)
+
+    def _top_entries(self, table: Dict[str, Dict[str, float]], field: str, n: int) -> List[Tuple[str, Dict[str, float]]]:
+        """The n entries with the largest `field` value, largest first (ties keep table order)."""
+        items = list(table.items())
+        values = np.fromiter((data[field] for _, data in items), dtype=float, count=len(items))
+        return [items[i] for i in top_k_indices(values, n)]
+
     # ============================================================================
     # TASK 4: CONCENTRATION INDEX (HHI)
     # ============================================================================
 
+    @cached_json('hhi.json')
     def perform_hhi_analysis(self) -> Dict[str, Any]:
         """
         Calculate Herfindahl-Hirschman Index for export destinations, import sources, and commodities.
         """
         print("Performing Concentration Index (HHI) Analysis...")
 
-        # HHI calculation function
-        def calculate_hhi(shares):
-            """Calculate Herfindahl-Hirschman Index from market shares."""
-            return sum(share ** 2 for share in shares)
-
-        # Export destinations HHI
         countries = self.data['countries']
-        export_shares = []
-
-        # Calculate total exports across all countries and quarters
-        total_exports_all_countries = 0
-        for country in countries['exports']:
-            total_exports_all_countries += sum(country['values'].values())
-
-        for country in countries['exports']:
-            total_country_exports = sum(country['values'].values())
-            if total_exports_all_countries > 0:
-                share = total_country_exports / total_exports_all_countries
-                export_shares.append(share)
-
-        export_hhi = calculate_hhi(export_shares) if export_shares else 0
 
-        # Import sources HHI
-        import_shares = []
-
-        # Calculate total imports across all countries and quarters
-        total_imports_all_countries = 0
-        for country in countries['imports']:
-            total_imports_all_countries += sum(country['values'].values())
-
-        for country in countries['imports']:
-            total_country_imports = sum(country['values'].values())
-            if total_imports_all_countries > 0:
-                share = total_country_imports / total_imports_all_countries
-                import_shares.append(share)
-
-        import_hhi = calculate_hhi(import_shares) if import_shares else 0
-
-        # Commodity HHI
-        commodities = self.data['commodities']
-        export_commodity_shares = []
-
-        # Calculate total exports across all commodities and quarters
-        total_exports_all_commodities = 0
-        for commodity in commodities['exports']:
-            total_exports_all_commodities += sum(commodity['values'].values())
-
-        for commodity in commodities['exports']:
-            total_commodity_exports = sum(commodity['values'].values())
-            if total_exports_all_commodities > 0:
-                share = total_commodity_exports / total_exports_all_commodities
-                export_commodity_shares.append(share)
-
-        commodity_hhi = calculate_hhi(export_commodity_shares) if export_commodity_shares else 0
+        # Export destinations, import sources and export commodities HHI
+        export_hhi, export_shares = self._hhi(self.country_export_totals)
+        import_hhi, import_shares = self._hhi(self.country_import_totals)
+        commodity_hhi, export_commodity_shares = self._hhi(self.commodity_export_totals)
 
         # Interpret HHI values
-        def interpret_hhi(hhi_value):
-            if hhi_value < 0.01:
-                return "Highly competitive market"
-            elif hhi_value < 0.15:
-                return "Unconcentrated market"
-            elif hhi_value < 0.25:
-                return "Moderately concentrated"
-            else:
-                return "Highly concentrated market"
+        export_label = interpret_hhi(export_hhi)
+        import_label = interpret_hhi(import_hhi)
+        commodity_label = interpret_hhi(commodity_hhi)
 
         # Generate insights
         insights = []
 
-        insights.append(f"Export destinations HHI: {export_hhi:.4f} - {interpret_hhi(export_hhi)}")
-        insights.append(f"Import sources HHI: {import_hhi:.4f} - {interpret_hhi(import_hhi)}")
-        insights.append(f"Export commodities HHI: {commodity_hhi:.4f} - {interpret_hhi(commodity_hhi)}")
+        insights.append(f"Export destinations HHI: {export_hhi:.4f} - {export_label}")
+        insights.append(f"Import sources HHI: {import_hhi:.4f} - {import_label}")
+        insights.append(f"Export commodities HHI: {commodity_hhi:.4f} - {commodity_label}")
 
         # Risk assessment
         if export_hhi > 0.25:
@@ -827,33 +877,31 @@ class RwandaTradeAnalytics:
             insights.append("High concentration in import sources increases supply chain risks")
 
         # Top contributors to concentration
-        if export_shares:
-            max_export_share = max(export_shares)
-            max_export_idx = export_shares.index(max_export_share)
+        if export_shares.size:
+            max_export_idx = int(np.argmax(export_shares))
             top_export_country = countries['exports'][max_export_idx]['country']
-            insights.append(f"Top export destination {top_export_country} represents {max_export_share*100:.1f}% of total exports")
+            insights.append(f"Top export destination {top_export_country} represents {export_shares[max_export_idx]*100:.1f}% of total exports")
 
-        if import_shares:
-            max_import_share = max(import_shares)
-            max_import_idx = import_shares.index(max_import_share)
+        if import_shares.size:
+            max_import_idx = int(np.argmax(import_shares))
             top_import_country = countries['imports'][max_import_idx]['country']
-            insights.append(f"Top import source {top_import_country} represents {max_import_share*100:.1f}% of total imports")
+            insights.append(f"Top import source {top_import_country} represents {import_shares[max_import_idx]*100:.1f}% of total imports")
 
         result = {
             "hhi": {
                 "export_destinations": {
                     "hhi_value": export_hhi,
-                    "interpretation": interpret_hhi(export_hhi),
+                    "interpretation": export_label,
                     "number_of_destinations": len(export_shares)
                 },
                 "import_sources": {
                     "hhi_value": import_hhi,
-                    "interpretation": interpret_hhi(import_hhi),
+                    "interpretation": import_label,
                     "number_of_sources": len(import_shares)
                 },
                 "commodity_hhi": {
                     "hhi_value": commodity_hhi,
-                    "interpretation": interpret_hhi(commodity_hhi),
+                    "interpretation": commodity_label,
                     "number_of_commodities": len(export_commodity_shares)
                 },
                 "insights": insights
@@ -864,10 +912,20 @@ class RwandaTradeAnalytics:
         print("HHI Analysis completed")
         return result
 
+    def _hhi(self, totals: np.ndarray) -> Tuple[float, np.ndarray]:
+        """Herfindahl-Hirschman Index of per-entity totals, with the shares it was built from."""
+        grand_total = totals.sum()
+        if grand_total <= 0:
+            return 0, np.zeros(0)
+        shares = totals / grand_total
+        # Sum of squared shares as a single dot product, without a squared temporary
+        return float(shares @ shares), shares
+
     # ============================================================================
     # TASK 5: BALANCE OF TRADE & STRUCTURAL ANALYSIS
     # ============================================================================
 
+    @cached_json('trade_balance.json')
     def perform_trade_balance_analysis(self) -> Dict[str, Any]:
         """
         Analyze trade balance, deficit drivers, and structural components.
@@ -881,22 +939,27 @@ class RwandaTradeAnalytics:
         trade_balance = overall['trade_balance']
 
         # Quarterly balance analysis
-        quarterly_balance = []
-        for i, quarter in enumerate(quarters):
-            quarterly_balance.append({
+        in_deficit = trade_balance < 0
+        deficit_amounts = np.where(in_deficit, -trade_balance, 0.0)
+        quarterly_balance = [
+            {
                 "quarter": quarter,
-                "exports": exports[i],
-                "imports": imports[i],
-                "trade_balance": trade_balance[i],
-                "deficit": trade_balance[i] < 0,
-                "deficit_amount": abs(trade_balance[i]) if trade_balance[i] < 0 else 0
-            })
+                "exports": exp,
+                "imports": imp,
+                "trade_balance": balance,
+                "deficit": deficit,
+                "deficit_amount": amount
+            }
+            for quarter, exp, imp, balance, deficit, amount in zip(
+                quarters, exports.tolist(), imports.tolist(), trade_balance.tolist(),
+                in_deficit.tolist(), deficit_amounts.tolist())
+        ]
 
         # Calculate balance statistics
-        deficits = [abs(b) for b in trade_balance if b < 0]
-        avg_deficit = np.mean(deficits) if deficits else 0
-        max_deficit = max(deficits) if deficits else 0
-        quarters_in_deficit = len(deficits)
+        deficits = deficit_amounts[in_deficit]
+        quarters_in_deficit = int(in_deficit.sum())
+        avg_deficit = float(deficits.mean()) if quarters_in_deficit else 0.0
+        max_deficit = float(deficits.max()) if quarters_in_deficit else 0.0
 
         # Deficit drivers analysis
         deficit_drivers = {
@@ -904,23 +967,24 @@ class RwandaTradeAnalytics:
             "maximum_deficit": max_deficit,
             "quarters_in_deficit": quarters_in_deficit,
             "total_deficit_periods": len(quarters),
-            "deficit_percentage": (quarters_in_deficit / len(quarters)) * 100
+            "deficit_percentage": 100.0 * quarters_in_deficit / trade_balance.size
         }
 
         # Regional contributions to deficit
         regional = self.data['regional']
         regional_contributions = {}
 
-        for region_data in regional['regional_blocks']:
-            if region_data['flow'] == 'Export':
-                region_exports = sum(region_data['values'].values())
-                region_imports = 0
+        region_totals = self._entity_totals(regional['regional_blocks']).tolist()
+        region_flows = list(zip(regional['regional_blocks'], region_totals))
 
-                # Find corresponding import data
-                for imp_region in regional['regional_blocks']:
-                    if imp_region['flow'] == 'Import' and imp_region['region'] == region_data['region']:
-                        region_imports = sum(imp_region['values'].values())
-                        break
+        # Import totals by region, looked up once per exporting region
+        imports_by_region = self._totals_by_key(
+            (region_data['region'], total) for region_data, total in region_flows if region_data['flow'] == 'Import'
+        )
+
+        for region_data, region_exports in region_flows:
+            if region_data['flow'] == 'Export':
+                region_imports = imports_by_region.get(region_data['region'], 0)
 
                 region_balance = region_exports - region_imports
                 regional_contributions[region_data['region']] = {
@@ -934,15 +998,13 @@ class RwandaTradeAnalytics:
         commodities = self.data['commodities']
         commodity_contributions = {}
 
-        for commodity in commodities['exports']:
-            comm_exports = sum(commodity['values'].values())
-            comm_imports = 0
+        # Import totals by SITC section, looked up once per export commodity
+        imports_by_section = self._totals_by_key(
+            zip((imp_comm['section'] for imp_comm in commodities['imports']), self.commodity_import_totals.tolist())
+        )
 
-            # Find corresponding import commodity
-            for imp_comm in commodities['imports']:
-                if imp_comm['section'] == commodity['section']:
-                    comm_imports = sum(imp_comm['values'].values())
-                    break
+        for commodity, comm_exports in zip(commodities['exports'], self.commodity_export_totals.tolist()):
+            comm_imports = imports_by_section.get(commodity['section'], 0)
 
             comm_balance = comm_exports - comm_imports
             commodity_contributions[commodity['description']] = {
@@ -960,15 +1022,11 @@ class RwandaTradeAnalytics:
         insights.append(f"Maximum quarterly deficit: ${max_deficit:,.0f}")
 
         # Top deficit contributors
-        sorted_regions = sorted(regional_contributions.items(),
-                              key=lambda x: x[1]['contribution_to_deficit'], reverse=True)
-        for region, data in sorted_regions[:3]:
+        for region, data in self._top_entries(regional_contributions, 'contribution_to_deficit', 3):
             if data['contribution_to_deficit'] > 0:
                 insights.append(f"Region {region} contributes ${data['contribution_to_deficit']:,.0f} to total deficit")
 
-        sorted_commodities = sorted(commodity_contributions.items(),
-                                  key=lambda x: x[1]['contribution_to_deficit'], reverse=True)
-        for commodity, data in sorted_commodities[:3]:
+        for commodity, data in self._top_entries(commodity_contributions, 'contribution_to_deficit', 3):
             if data['contribution_to_deficit'] > 0:
                 insights.append(f"Commodity {commodity} contributes ${data['contribution_to_deficit']:,.0f} to total deficit")
 
@@ -986,10 +1044,18 @@ class RwandaTradeAnalytics:
         print("Trade Balance Analysis completed")
         return result
 
+    def _totals_by_key(self, keyed_totals) -> Dict[Any, float]:
+        """Map each key to its total, keeping the first total when a key repeats."""
+        totals_by_key = {}
+        for key, total in keyed_totals:
+            totals_by_key.setdefault(key, total)
+        return totals_by_key
+
     # ============================================================================
     # TASK 6: CORRELATION & DEPENDENCY ANALYSIS
     # ============================================================================
 
+    @cached_json('correlations.json')
     def perform_correlation_analysis(self) -> Dict[str, Any]:
         """
         Analyze correlations between trade variables and identify dependencies.
@@ -1002,102 +1068,90 @@ class RwandaTradeAnalytics:
         trade_balance = overall['trade_balance']
 
         # Create correlation matrix
-        trade_data = pd.DataFrame({
-            'exports': exports,
-            'imports': imports,
-            'trade_balance': trade_balance
-        })
-
-        correlation_matrix = trade_data.corr()
+        variables = ('exports', 'imports', 'trade_balance')
+        # A constant series has no defined correlation; report it as 0 (no correlation), as for
+        # the concentration correlation below
+        correlation_matrix = np.nan_to_num(np.corrcoef(np.vstack([exports, imports, trade_balance])), nan=0.0)
+        correlation_rows = correlation_matrix.tolist()
 
         # Convert to dictionary format
-        corr_dict = {}
-        for col1 in correlation_matrix.columns:
-            corr_dict[col1] = {}
-            for col2 in correlation_matrix.columns:
-                corr_dict[col1][col2] = correlation_matrix.loc[col1, col2]
+        corr_dict = {var: dict(zip(variables, row)) for var, row in zip(variables, correlation_rows)}
 
-        # Identify strong relationships
+        # Identify strong relationships (upper triangle only, to avoid duplicate pairs)
         strong_relationships = []
-        for i, col1 in enumerate(correlation_matrix.columns):
-            for j, col2 in enumerate(correlation_matrix.columns):
-                if i < j:  # Avoid duplicate pairs
-                    corr_value = correlation_matrix.loc[col1, col2]
-                    if abs(corr_value) > 0.7:  # Strong correlation threshold
-                        strength = "strong positive" if corr_value > 0 else "strong negative"
-                        strong_relationships.append({
-                            "variables": f"{col1} vs {col2}",
-                            "correlation": corr_value,
-                            "strength": strength,
-                            "interpretation": f"{col1.replace('_', ' ').title()} and {col2.replace('_', ' ').title()} show {strength} correlation (r = {corr_value:.3f})"
-                        })
+        upper_i, upper_j = np.triu_indices(len(variables), 1)
+        strong = np.abs(correlation_matrix[upper_i, upper_j]) > 0.7  # Strong correlation threshold
+        for i, j in zip(upper_i[strong].tolist(), upper_j[strong].tolist()):
+            col1, col2 = variables[i], variables[j]
+            corr_value = correlation_rows[i][j]
+            strength = "strong positive" if corr_value > 0 else "strong negative"
+            strong_relationships.append({
+                "variables": f"{col1} vs {col2}",
+                "correlation": corr_value,
+                "strength": strength,
+                "interpretation": f"{col1.replace('_', ' ').title()} and {col2.replace('_', ' ').title()} show {strength} correlation (r = {corr_value:.3f})"
+            })
 
         # Country-level correlations
-        countries = self.data['countries']
         country_correlations = []
 
-        # Analyze export concentration vs balance
-        export_concentration = []
-        for i, quarter in enumerate(overall['quarters']):
-            # Calculate HHI for this quarter
-            quarter_exports = []
-            for country in countries['exports']:
-                if quarter in country['values']:
-                    quarter_exports.append(country['values'][quarter])
-
-            if quarter_exports:
-                hhi = sum((share ** 2) for share in [e / sum(quarter_exports) for e in quarter_exports])
-                export_concentration.append(hhi)
-            else:
-                export_concentration.append(0)
+        # Analyze export concentration vs balance: per-quarter HHI of the country export shares,
+        # with quarters that have no country exports scored as 0
+        quarter_totals = self.country_export_mat.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            quarter_hhi = np.square(self.country_export_mat / quarter_totals).sum(axis=0)
+        export_concentration = np.where(quarter_totals > 0, quarter_hhi, 0.0)
 
         # Correlation between export concentration and trade balance
         if len(export_concentration) == len(trade_balance) and len(export_concentration) > 1:
-            try:
-                conc_balance_corr = np.corrcoef(export_concentration, trade_balance)[0, 1]
-                if np.isnan(conc_balance_corr):
-                    conc_balance_corr = 0.0  # Default to no correlation if NaN
-                country_correlations.append({
-                    "analysis": "Export concentration vs Trade balance",
-                    "correlation": conc_balance_corr,
-                    "interpretation": f"Export market concentration and trade balance show {'positive' if conc_balance_corr > 0 else 'negative'} correlation (r = {conc_balance_corr:.3f})"
-                })
-            except:
-                country_correlations.append({
-                    "analysis": "Export concentration vs Trade balance",
-                    "correlation": 0.0,
-                    "interpretation": "Unable to calculate correlation between export concentration and trade balance"
-                })
-
-        # Regional dependencies
-        regional = self.data['regional']
-        regional_deps = []
+            # Default to no correlation if NaN (e.g. concentration constant across quarters)
+            conc_balance_corr = float(np.nan_to_num(np.corrcoef(export_concentration, trade_balance)[0, 1]))
+            country_correlations.append({
+                "analysis": "Export concentration vs Trade balance",
+                "correlation": conc_balance_corr,
+                "interpretation": f"Export market concentration and trade balance show {'positive' if conc_balance_corr > 0 else 'negative'} correlation (r = {conc_balance_corr:.3f})"
+            })
 
-        for region_data in regional['regional_blocks']:
-            if region_data['flow'] == 'Export':
-                region_values = list(region_data['values'].values())
-                if len(region_values) > 1:
-                    # Correlation with overall exports
-                    overall_quarterly = overall['exports'][:len(region_values)]
-                    if len(overall_quarterly) == len(region_values):
-                        corr = np.corrcoef(region_values, overall_quarterly)[0, 1]
-                        regional_deps.append({
-                            "region": region_data['region'],
-                            "correlation_with_overall": corr,
-                            "dependency_level": "High" if abs(corr) > 0.8 else "Medium" if abs(corr) > 0.5 else "Low"
-                        })
+        # Regional dependencies: each export region's series is correlated with overall exports over
+        # the same leading quarters, batched across regions reporting the same number of quarters
+        regional = self.data['regional']
+        dependency_rows = [
+            (region_data['region'], list(region_data['values'].values()))
+            for region_data in regional['regional_blocks']
+            if region_data['flow'] == 'Export' and 1 < len(region_data['values']) <= len(overall['exports'])
+        ]
+
+        rows_by_length = {}
+        for position, (_, region_values) in enumerate(dependency_rows):
+            rows_by_length.setdefault(len(region_values), []).append(position)
+
+        region_corrs = np.empty(len(dependency_rows))
+        for length, positions in rows_by_length.items():
+            region_matrix = np.array([dependency_rows[position][1] for position in positions], dtype=np.float64)
+            region_corrs[positions] = self._row_correlations(region_matrix, overall['exports'][:length])
+
+        abs_corrs = np.abs(region_corrs)
+        dependency_levels = np.select([abs_corrs > 0.8, abs_corrs > 0.5], ["High", "Medium"], default="Low")
+        regional_deps = [
+            {
+                "region": region,
+                "correlation_with_overall": corr,
+                "dependency_level": level
+            }
+            for (region, _), corr, level in zip(dependency_rows, region_corrs.tolist(), dependency_levels.tolist())
+        ]
 
         # Create heatmap-ready data
-        heatmap_data = []
-        for i, var1 in enumerate(correlation_matrix.columns):
-            for j, var2 in enumerate(correlation_matrix.columns):
-                heatmap_data.append({
-                    "x": i,
-                    "y": j,
-                    "value": correlation_matrix.loc[var1, var2],
-                    "variable1": var1,
-                    "variable2": var2
-                })
+        heatmap_data = [
+            {
+                "x": i,
+                "y": j,
+                "value": correlation_rows[i][j],
+                "variable1": variables[i],
+                "variable2": variables[j]
+            }
+            for i, j in np.ndindex(correlation_matrix.shape)
+        ]
 
         # Generate insights
         insights = []
@@ -1110,7 +1164,7 @@ class RwandaTradeAnalytics:
                 insights.append(corr['interpretation'])
 
         # Overall trade health assessment
-        exp_imp_corr = correlation_matrix.loc['exports', 'imports']
+        exp_imp_corr = corr_dict['exports']['imports']
         if exp_imp_corr > 0.5:
             insights.append("Strong positive correlation between exports and imports suggests synchronized trade growth")
         elif exp_imp_corr < -0.5:
@@ -1131,37 +1185,24 @@ class RwandaTradeAnalytics:
         print("Correlation Analysis completed")
         return result
 
+    def _row_correlations(self, rows: np.ndarray, target: np.ndarray) -> np.ndarray:
+        """Pearson correlation of each row of `rows` with `target` (NaN for a constant series)."""
+        rows_centered = rows - rows.mean(axis=1, keepdims=True)
+        target_centered = target - target.mean()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (rows_centered @ target_centered) / (
+                np.linalg.norm(rows_centered, axis=1) * np.linalg.norm(target_centered))
+
     # ============================================================================
     # UTILITY METHODS
     # ============================================================================
 
     def save_json(self, data: Dict, filename: str):
         """Save data to JSON file."""
-        def convert_numpy_types(obj):
-            """Convert numpy types to Python types for JSON serialization."""
-            if isinstance(obj, np.integer):
-                return int(obj)
-            elif isinstance(obj, np.floating):
-                # Handle NaN values by converting to None (null in JSON)
-                val = float(obj)
-                return None if np.isnan(val) else val
-            elif isinstance(obj, np.ndarray):
-                return obj.tolist()
-            elif isinstance(obj, np.bool_):
-                return bool(obj)
-            elif isinstance(obj, dict):
-                return {key: convert_numpy_types(value) for key, value in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_numpy_types(item) for item in obj]
-            elif isinstance(obj, float) and np.isnan(obj):
-                # Handle regular float NaN values
-                return None
-            else:
-                return obj
-
+        # orjson encodes numpy scalars, arrays and bools natively and writes NaN as null
         filepath = os.path.join(self.output_dir, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(convert_numpy_types(data), f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, default=orjson_default, option=ORJSON_OPTIONS | orjson.OPT_INDENT_2))
         print(f"Saved {filename}")
 
     def run_all_analyses(self):
@@ -1172,23 +1213,26 @@ class RwandaTradeAnalytics:
         results = {}
 
         try:
-            # Task 1: Time Series Analysis
-            results['time_series'] = self.perform_time_series_analysis()
-
-            # Task 2: Comparative Growth Analysis
-            results['growth'] = self.perform_growth_analysis()
-
-            # Task 3: Contribution & Share Analysis
-            results['share'] = self.perform_share_analysis()
-
-            # Task 4: Concentration Index (HHI)
-            results['hhi'] = self.perform_hhi_analysis()
-
-            # Task 5: Balance of Trade & Structural Analysis
-            results['trade_balance'] = self.perform_trade_balance_analysis()
+            # The six analyses only read self.data and each writes its own JSON file,
+            # so run them concurrently
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                futures = {
+                    # Task 1: Time Series Analysis
+                    'time_series': executor.submit(self.perform_time_series_analysis),
+                    # Task 2: Comparative Growth Analysis
+                    'growth': executor.submit(self.perform_growth_analysis),
+                    # Task 3: Contribution & Share Analysis
+                    'share': executor.submit(self.perform_share_analysis),
+                    # Task 4: Concentration Index (HHI)
+                    'hhi': executor.submit(self.perform_hhi_analysis),
+                    # Task 5: Balance of Trade & Structural Analysis
+                    'trade_balance': executor.submit(self.perform_trade_balance_analysis),
+                    # Task 6: Correlation & Dependency Analysis
+                    'correlations': executor.submit(self.perform_correlation_analysis)
+                }
 
-            # Task 6: Correlation & Dependency Analysis
-            results['correlations'] = self.perform_correlation_analysis()
+                for name, future in futures.items():
+                    results[name] = future.result()
 
             print("=" * 60)
             print("All analyses completed successfully!")
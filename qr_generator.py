@@ -1,25 +1,58 @@
+import hashlib
+import os
+
 import qrcode
 
 # URL to encode in QR code
-url = "http://192.168.90.52:3001/"
+URL = "http://192.168.90.52:3001/"
+OUTPUT_FILE = "local_server_qr.png"
+
+
+def generate_qr(url, out_path, error_correction=qrcode.constants.ERROR_CORRECT_L, box_size=10, border=4):
+    """
+    Save a QR code for `url` as a PNG at `out_path`.
+
+    A `<out_path>.hash` sidecar (git-ignored) records the URL and settings the image was made
+    from, plus the PNG's mtime and size after writing it. The image is left as is only when all
+    of these still match, so a deleted or replaced PNG is regenerated. Returns True if the image
+    was (re)generated.
+    """
+    digest = hashlib.sha1(f"{url}|{error_correction}|{box_size}|{border}".encode()).hexdigest()[:8]
+    hash_path = f"{out_path}.hash"
+
+    try:
+        stat = os.stat(out_path)
+        with open(hash_path, encoding="utf-8") as f:
+            if f.read().strip() == f"{digest}:{stat.st_mtime_ns}:{stat.st_size}":
+                return False
+    except OSError:
+        pass
+
+    # Create QR code instance
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=error_correction,
+        box_size=box_size,
+        border=border,
+    )
 
-# Create QR code instance
-qr = qrcode.QRCode(
-    version=1,
-    error_correction=qrcode.constants.ERROR_CORRECT_L,
-    box_size=10,
-    border=4,
-)
+    # Add data to QR code
+    qr.add_data(url)
+    qr.make(fit=True)
 
-# Add data to QR code
-qr.add_data(url)
-qr.make(fit=True)
+    # Generate image and save to file
+    img = qr.make_image(fill_color="black", back_color="white")
+    img.save(out_path)
 
-# Generate image
-img = qr.make_image(fill_color="black", back_color="white")
+    stat = os.stat(out_path)
+    with open(hash_path, "w", encoding="utf-8") as f:
+        f.write(f"{digest}:{stat.st_mtime_ns}:{stat.st_size}")
+    return True
 
-# Save to file
-img.save("local_server_qr.png")
 
-print("QR code saved as 'local_server_qr.png'")
-print("Scan this QR code to access:", url)
\ No newline at end of file
+if __name__ == "__main__":
+    if generate_qr(URL, OUTPUT_FILE):
+        print(f"QR code saved as '{OUTPUT_FILE}'")
+    else:
+        print(f"QR code '{OUTPUT_FILE}' is already up to date")
+    print("Scan this QR code to access:", URL)